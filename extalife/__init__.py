@@ -23,7 +23,7 @@ from homeassistant.helpers.entity_component import DEFAULT_SCAN_INTERVAL
 from homeassistant.helpers.device_registry import DeviceInfo
 
 from homeassistant.helpers.typing import ConfigType
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.components.switch import DOMAIN as DOMAIN_SWITCH
 from homeassistant.components.light import DOMAIN as DOMAIN_LIGHT
 from homeassistant.components.binary_sensor import DOMAIN as DOMAIN_BINARY_SENSOR
@@ -99,6 +99,24 @@ _LOGGER = logging.getLogger(__name__)
 
 OPTIONS_DEFAULTS = get_default_options()
 
+# device type to HA platform mapping, computed once; groups are listed in priority order - first matching wins
+_DOMAIN_IGNORE = "ignore"
+_MAP_DEVICE_TYPE_TO_DOMAIN: dict[int, str] = {
+    device_type: domain
+    for domain, device_types in reversed((
+        (_DOMAIN_IGNORE, DEVICE_ARR_ALL_IGNORE),
+        (DOMAIN_SWITCH, DEVICE_ARR_ALL_SWITCH),
+        (DOMAIN_LIGHT, DEVICE_ARR_ALL_LIGHT),
+        (DOMAIN_COVER, DEVICE_ARR_ALL_COVER),
+        (DOMAIN_SENSOR, DEVICE_ARR_ALL_SENSOR_MEAS),
+        (DOMAIN_BINARY_SENSOR, DEVICE_ARR_ALL_SENSOR_BINARY),
+        (DOMAIN_SENSOR, DEVICE_ARR_ALL_SENSOR_MULTI),
+        (DOMAIN_CLIMATE, DEVICE_ARR_ALL_CLIMATE),
+        (DOMAIN_TRANSMITTER, DEVICE_ARR_ALL_TRANSMITTER),
+    ))
+    for device_type in device_types
+}
+
 # schema validations
 OPTIONS_CONF_SCHEMA = {
     vol.Optional(OPTIONS_GENERAL, default=OPTIONS_DEFAULTS[OPTIONS_GENERAL]): {
@@ -209,13 +227,13 @@ async def async_setup_entry(
         config_entry: ConfigEntry) -> bool:
     """Set up Exta Life component from a Config Entry"""
 
-    _LOGGER.debug(f"async_setup_entry(): starting for '{config_entry.title}' (entry_id='{config_entry.entry_id}')")
+    _LOGGER.debug("async_setup_entry(): starting for '%s' (entry_id='%s')", config_entry.title, config_entry.entry_id)
 
     hass.data.setdefault(DOMAIN, {})
     Core.create(hass, config_entry)
     result = await initialize(hass, config_entry)
 
-    _LOGGER.debug(f"async_setup_entry(): finished for '{config_entry.title}' (entry_id='{config_entry.entry_id}')")
+    _LOGGER.debug("async_setup_entry(): finished for '%s' (entry_id='%s')", config_entry.title, config_entry.entry_id)
 
     return result
 
@@ -226,12 +244,12 @@ async def async_unload_entry(
         config_entry: ConfigEntry) -> bool:
     """Unload a config entry: unload platform entities, stored data, deregister signal listeners"""
 
-    _LOGGER.debug(f"async_unload_entry(): starting for '{config_entry.title}' (entry_id='{config_entry.entry_id}')")
+    _LOGGER.debug("async_unload_entry(): starting for '%s' (entry_id='%s')", config_entry.title, config_entry.entry_id)
 
     core = Core.get(config_entry.entry_id)
     result = await core.unload_entry_from_hass()
 
-    _LOGGER.debug(f"async_unload_entry(): finished for '{config_entry.title}' (entry_id='{config_entry.entry_id}')")
+    _LOGGER.debug("async_unload_entry(): finished for '%s' (entry_id='%s')", config_entry.title, config_entry.entry_id)
 
     return result
 
@@ -348,7 +366,7 @@ class ChannelDataManager:
         return self.core.api
 
     def on_notify(self, data: ExtaLifeData) -> None:
-        _LOGGER.debug(f"Received status change notification from controller: {data}")
+        _LOGGER.debug("Received status change notification from controller: %s", data)
 
         channel = data.get("channel", "#")
         channel_id = str(data.get("id")) + "-" + str(channel)
@@ -381,7 +399,7 @@ class ChannelDataManager:
         """Get the latest device&channel status data from EFC-01.
         This method is called from HA task scheduler via async_track_time_interval"""
 
-        _LOGGER.debug(f"[{self.core.config_entry.title}] Executing EFC-01 status polling")
+        _LOGGER.debug("[%s] Executing EFC-01 status polling", self.core.config_entry.title)
         # use Exta Life TCP communication class
 
         # if connection error or other - will receive None
@@ -399,7 +417,7 @@ class ChannelDataManager:
 
         self.core.async_signal_send(SIGNAL_DATA_UPDATED)
 
-        _LOGGER.debug(f"[{self.core.config_entry.title}] Status for {len(self.channels_indx)} devices updated")
+        _LOGGER.debug("[%s] Status for %d devices updated", self.core.config_entry.title, len(self.channels_indx))
 
         await self.async_discover_devices()
 
@@ -412,7 +430,7 @@ class ChannelDataManager:
         """Stop status polling task scheduler"""
         if self._polling_task_remove is not None:
             self._polling_task_remove()
-            _LOGGER.debug(f"Polling task has been removed")
+            _LOGGER.debug("Polling task has been removed")
         self._polling_task_remove = None
 
     def polling_task_configure(self) -> None:
@@ -425,7 +443,7 @@ class ChannelDataManager:
             OPTIONS_GENERAL_POLL_INTERVAL
         )
 
-        _LOGGER.debug(f"Periodic poll task interval has been set to {interval} minute(s)")
+        _LOGGER.debug("Periodic poll task interval has been set to %s minute(s)", interval)
         self._polling_task_remove = self.core.async_track_time_interval(
             self._async_polling_task, timedelta(minutes=interval)
         )
@@ -440,6 +458,9 @@ class ChannelDataManager:
 
         # get data from the ChannelDataManager object stored in HA object data
 
+        # icons forcing 'light' platform, resolved on first switch channel only, then reused
+        light_icons: frozenset | None = None
+
         entities = 0
         for channel_id, channel_data in self.channels_indx.items():  # -> dict id:data
 
@@ -449,40 +470,20 @@ class ChannelDataManager:
 
             channel = {"id": channel_id, "data": channel_data}
             device_type = channel_data.get("type")
-            component_name = None
+            component_name = _MAP_DEVICE_TYPE_TO_DOMAIN.get(device_type)
 
             # skip some devices that are not to be shown nor controlled by HA
-            if device_type in DEVICE_ARR_ALL_IGNORE:
+            if component_name == _DOMAIN_IGNORE:
                 continue
 
-            if device_type in DEVICE_ARR_ALL_SWITCH:
+            if component_name == DOMAIN_SWITCH:
                 icon = channel["data"]["icon"]
-                if icon in self._config_entry.options.get(DOMAIN_LIGHT).get(
-                    OPTIONS_LIGHT_ICONS_LIST
-                ):
+                if light_icons is None:
+                    light_icons = frozenset(self._config_entry.options.get(DOMAIN_LIGHT).get(OPTIONS_LIGHT_ICONS_LIST))
+                if icon in light_icons:
                     component_name = DOMAIN_LIGHT
-                else:
-                    component_name = DOMAIN_SWITCH
-
-            elif device_type in DEVICE_ARR_ALL_LIGHT:
-                component_name = DOMAIN_LIGHT
-
-            elif device_type in DEVICE_ARR_ALL_COVER:
-                component_name = DOMAIN_COVER
-
-            elif device_type in DEVICE_ARR_ALL_SENSOR_MEAS:
-                component_name = DOMAIN_SENSOR
-
-            elif device_type in DEVICE_ARR_ALL_SENSOR_BINARY:
-                component_name = DOMAIN_BINARY_SENSOR
-
-            elif device_type in DEVICE_ARR_ALL_SENSOR_MULTI:
-                component_name = DOMAIN_SENSOR
-
-            elif device_type in DEVICE_ARR_ALL_CLIMATE:
-                component_name = DOMAIN_CLIMATE
 
-            elif device_type in DEVICE_ARR_ALL_TRANSMITTER:
+            elif component_name == DOMAIN_TRANSMITTER:
                 other_configs.setdefault(DOMAIN_TRANSMITTER, []).append(channel)
                 continue
 
@@ -493,7 +494,7 @@ class ChannelDataManager:
             component_configs.setdefault(component_name, []).append(channel)
             entities += 1
 
-        _LOGGER.debug(f"Exta Life devices found during discovery: {entities}")
+        _LOGGER.debug("Exta Life devices found during discovery: %s", entities)
 
         # Load discovered devices
 
@@ -510,7 +511,7 @@ class ChannelDataManager:
 
             if len(channels_for_update) > 0:
                 component_configs.setdefault(DOMAIN_UPDATE, channels_for_update)
-                _LOGGER.debug(f"Found {len(uniq_serials)} devices for updates monitoring")
+                _LOGGER.debug("Found %d devices for updates monitoring", len(uniq_serials))
 
             # can happen we don't have any sensors, so we need to put an empty list to trigger
             # creation of virtual sensors (if any) for
@@ -556,7 +557,7 @@ class ExtaLifeChannel(Entity):
     async def async_action(self, action, **add_pars: Any) -> dict[str, Any] | None:
         """Run controller command/action. Actions are currently hardcoded in platforms"""
 
-        _LOGGER.debug(f"Executing action '{action}' on channel {self.channel_id}, params: {add_pars}")
+        _LOGGER.debug("Executing action '%s' on channel %s, params: %s", action, self.channel_id, add_pars)
 
         return await self.controller.async_execute_action(action, self.channel_id, **add_pars)
 
@@ -568,7 +569,7 @@ class ExtaLifeChannel(Entity):
         # read "data" section/dict by channel id
         data = channel_indx.get(self.channel_id)
 
-        _LOGGER.debug(f"async_update() for entity: {self.entity_id}, data to be updated: {data}")
+        _LOGGER.debug("async_update() for entity: %s, data to be updated: %s", self.entity_id, data)
 
         if data is None:
             self.data_available = False
@@ -633,7 +634,7 @@ class ExtaLifeChannel(Entity):
 
         virtual_sensors = self._get_virtual_sensors()
         if len(virtual_sensors):
-            _LOGGER.debug(f"Virtual sensors: {virtual_sensors}")
+            _LOGGER.debug("Virtual sensors: %s", virtual_sensors)
             for virtual in virtual_sensors:
                 v_channel_data = channel_data.copy()
                 v_channel_data.update({VIRTUAL_SENSOR_CHN_FIELD: virtual})
@@ -642,7 +643,7 @@ class ExtaLifeChannel(Entity):
     async def async_added_to_hass(self) -> None:
         await super().async_added_to_hass()
 
-        _LOGGER.debug(f"async_added_to_hass: entity: {self.entity_id}")
+        _LOGGER.debug("async_added_to_hass: entity: %s", self.entity_id)
         self.core.async_signal_register(SIGNAL_DATA_UPDATED, self.async_update_callback)
 
         self.core.async_signal_register(
@@ -653,15 +654,17 @@ class ExtaLifeChannel(Entity):
     async def async_will_remove_from_hass(self) -> None:
         await super().async_will_remove_from_hass()
 
-    async def async_update_callback(self) -> None:
+    @callback
+    def async_update_callback(self) -> None:
         """Inform HA of state update from status poller"""
         _LOGGER.debug("Update callback for entity id: %s", self.entity_id)
         self.async_schedule_update_ha_state(True)
 
-    async def async_state_notif_update_callback(self, *args: Any) -> None:
+    @callback
+    def async_state_notif_update_callback(self, *args: Any) -> None:
         """Inform HA of state change received from controller status notification"""
         data = args[0]
-        _LOGGER.debug(f"State update notification callback for entity id: {self.entity_id}, data: {data}")
+        _LOGGER.debug("State update notification callback for entity id: %s, data: %s", self.entity_id, data)
 
         self.on_state_notification(data)
 
@@ -676,7 +679,7 @@ class ExtaLifeChannel(Entity):
     def assumed_state(self) -> bool:
         """Returns boolean if entity status is assumed status"""
         ret = self.is_exta_free
-        _LOGGER.debug(f"Assumed state for entity: {self.entity_id}, {ret}")
+        _LOGGER.debug("Assumed state for entity: %s, %s", self.entity_id, ret)
         return ret
 
     @property
@@ -687,8 +690,8 @@ class ExtaLifeChannel(Entity):
             if self.config_entry.options.get(OPTIONS_GENERAL_DISABLE_NOT_RESPONDING)
             else False
         )
-        _LOGGER.debug(f"available() for entity: {self.entity_id}. "
-                      f"self.data_available: {self.data_available}; 'is_timeout': {is_timeout}")
+        _LOGGER.debug("available() for entity: %s. self.data_available: %s; 'is_timeout': %s",
+                      self.entity_id, self.data_available, is_timeout)
 
         return self.data_available is True and is_timeout is False
 
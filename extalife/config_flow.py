@@ -133,7 +133,7 @@ class ExtaLifeFlowHandler(ConfigFlow):
         controller_addr: str = self._import_data.get(CONF_CONTROLLER_IP) if self._import_data else self._controller_addr
         description_placeholders: dict[str, str] = {"error_info": ""}
         if user_input is None or (self._import_data is not None and self._import_data.get(CONF_CONTROLLER_IP) is None):
-            controller_addr = await self.hass.async_add_executor_job(ExtaLifeAPI.discover_controller, **{})
+            controller_addr = await ExtaLifeAPI.async_discover_controller(self.hass.loop)
 
         if user_input is not None or self._import_data is not None:
 
@@ -428,8 +428,16 @@ class Core:
 
         for target in target_list:
             _LOGGER.debug("async_signal_send(), target: %s", target)
-            coroutine = target(*args)
-            self._hass.async_create_task(coroutine)
+            # callback targets run inline, failure of one target must not break delivery to the others
+            # nor propagate into the controller connection read task which is the caller here
+            try:
+                result = target(*args)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("async_signal_send(), target %s failed for signal: %s", target, signal)
+                continue
+            # only coroutine targets need a task, callbacks have already run
+            if asyncio.iscoroutine(result):
+                self._hass.async_create_task(result)
 
     def async_signal_send_sync(self, signal: str, args) -> None:
         """Send signal and data.
@@ -77,25 +77,25 @@ MAP_MODE_VAL_EFFECT = {
 }
 MAP_EFFECT_MODE_VAL = {v: k for k, v in MAP_MODE_VAL_EFFECT.items()}
 
-SUPPORT_BRIGHTNESS = [
+SUPPORT_BRIGHTNESS = (
     ExtaLifeDeviceModel.RDP21,
     ExtaLifeDeviceModel.SLN21,
     ExtaLifeDeviceModel.SLN22,
     ExtaLifeDeviceModel.SLR21,
     ExtaLifeDeviceModel.SLR22,
-]
-SUPPORT_COLOR = [
+)
+SUPPORT_COLOR = (
     ExtaLifeDeviceModel.SLN22,
     ExtaLifeDeviceModel.SLR22,
-]
-SUPPORT_WHITE = [
+)
+SUPPORT_WHITE = (
     ExtaLifeDeviceModel.SLN22,
     ExtaLifeDeviceModel.SLR22,
-]
-SUPPORT_EFFECT = [
+)
+SUPPORT_EFFECT = (
     ExtaLifeDeviceModel.SLN22,
     ExtaLifeDeviceModel.SLR22,
-]
+)
 
 
 def scale_to_255(value: float) -> int:
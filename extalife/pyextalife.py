@@ -1,22 +1,32 @@
 """ ExtaLife JSON API wrapper library. Enables device control, discovery and status fetching from EFC-01 controller """
 from __future__ import print_function
 import asyncio
+import functools
+import ipaddress
 import json
 import logging
 import re
 import socket
 import os
+import struct
 import sys
+import time
 
 from asyncio import (
+    BaseTransport,
+    BufferedProtocol,
     CancelledError as AsyncCancelledError,
+    Future,
+    Handle,
     Lock,
-    StreamReader,
-    StreamWriter,
+    Queue,
     Task,
+    TimerHandle,
+    Transport,
     TimeoutError as AsyncTimeoutError,
 )
 from asyncio.events import AbstractEventLoop
+from collections import deque
 from datetime import datetime
 from enum import (
     IntEnum,
@@ -27,9 +37,23 @@ from typing import (
     Any,
     Awaitable,
     Callable,
+    Iterator,
+    NamedTuple,
     Tuple,
 )
 
+try:
+    # orjson is shipped with Home Assistant, fall back to stdlib json when used standalone
+    import orjson
+
+    _json_dumpb: Callable[[Any], bytes] = orjson.dumps
+    _json_loads: Callable[[str | bytes], Any] = orjson.loads
+except ImportError:
+    def _json_dumpb(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    _json_loads: Callable[[str | bytes], Any] = json.loads
+
 _LOGGER = logging.getLogger(__name__)
 
 # controller info
@@ -38,6 +62,25 @@ PRODUCT_SERIES = "Exta Life"
 PRODUCT_SERIES_EXTA_FREE = "Exta Free"
 PRODUCT_CONTROLLER_MODEL = "EFC-01"
 
+# controller autodiscovery (UDP multicast)
+_MCAST_GROUP = "225.0.0.1"
+_MCAST_PORT = 20401
+_MCAST_REQ = struct.pack("4sL", socket.inet_aton(_MCAST_GROUP), socket.INADDR_ANY)
+_MCAST_LOOP = 0
+
+# controller connection keepalive probes detect dead peer even when application ping is disabled
+_TCP_KEEPALIVE_OPTS = tuple(
+    (getattr(socket, name), value)
+    for name, value in (("TCP_KEEPIDLE", 30), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3))
+    if hasattr(socket, name)
+)
+
+# keepalive ping, NOOP command frame is constant
+_NOOP_BYTES = b" \x03"
+
+# masks login password in debug output
+_PWD_RE = re.compile(r'"password":\s*"(?:[^"\\]|\\.)*"')
+
 ExtaLifeResponseType = "ExtaLifeResponse"
 ExtaLifeActionType = "ExtaLifeAction"
 ExtaLifeErrorType = "ExtaLifeError"
@@ -210,70 +253,19 @@ class ExtaLifeAction(StrEnum):
 
 class ExtaLifeMap:
 
-    # device types string mapping
+    # device types string mapping, both enums use the same member names for given device model
     __MAP_TYPE_TO_MODEL_NAME: dict[ExtaLifeDeviceModel, ExtaLifeDeviceModelName] = {
-        ExtaLifeDeviceModel.RNK22: ExtaLifeDeviceModelName.RNK22,
-        ExtaLifeDeviceModel.RNK22_TEMP_SENSOR: ExtaLifeDeviceModelName.RNK22_TEMP_SENSOR,
-        ExtaLifeDeviceModel.RNK24: ExtaLifeDeviceModelName.RNK24,
-        ExtaLifeDeviceModel.RNK24_TEMP_SENSOR: ExtaLifeDeviceModelName.RNK24_TEMP_SENSOR,
-        ExtaLifeDeviceModel.P4572: ExtaLifeDeviceModelName.P4572,
-        ExtaLifeDeviceModel.P4574: ExtaLifeDeviceModelName.P4574,
-        ExtaLifeDeviceModel.P4578: ExtaLifeDeviceModelName.P4578,
-        ExtaLifeDeviceModel.P45736: ExtaLifeDeviceModelName.P45736,
-        ExtaLifeDeviceModel.LEDIX_P260: ExtaLifeDeviceModelName.LEDIX_P260,
-        ExtaLifeDeviceModel.ROP21: ExtaLifeDeviceModelName.ROP21,
-        ExtaLifeDeviceModel.ROP22: ExtaLifeDeviceModelName.ROP22,
-        ExtaLifeDeviceModel.SRP22: ExtaLifeDeviceModelName.SRP22,
-        ExtaLifeDeviceModel.RDP21: ExtaLifeDeviceModelName.RDP21,
-        ExtaLifeDeviceModel.GKN01: ExtaLifeDeviceModelName.GKN01,
-        ExtaLifeDeviceModel.ROP27: ExtaLifeDeviceModelName.ROP27,
-        ExtaLifeDeviceModel.RGT01: ExtaLifeDeviceModelName.RGT01,
-        ExtaLifeDeviceModel.RNM24: ExtaLifeDeviceModelName.RNM24,
-        ExtaLifeDeviceModel.RNP21: ExtaLifeDeviceModelName.RNP21,
-        ExtaLifeDeviceModel.RNP22: ExtaLifeDeviceModelName.RNP22,
-        ExtaLifeDeviceModel.RCT21: ExtaLifeDeviceModelName.RCT21,
-        ExtaLifeDeviceModel.RCT22: ExtaLifeDeviceModelName.RCT22,
-        ExtaLifeDeviceModel.ROG21: ExtaLifeDeviceModelName.ROG21,
-        ExtaLifeDeviceModel.ROM22: ExtaLifeDeviceModelName.ROM22,
-        ExtaLifeDeviceModel.ROM24: ExtaLifeDeviceModelName.ROM24,
-        ExtaLifeDeviceModel.SRM22: ExtaLifeDeviceModelName.SRM22,
-        ExtaLifeDeviceModel.SLR21: ExtaLifeDeviceModelName.SLR21,
-        ExtaLifeDeviceModel.SLR22: ExtaLifeDeviceModelName.SLR22,
-        ExtaLifeDeviceModel.RCM21: ExtaLifeDeviceModelName.RCM21,
-        ExtaLifeDeviceModel.MEM21: ExtaLifeDeviceModelName.MEM21,
-        ExtaLifeDeviceModel.RCR21: ExtaLifeDeviceModelName.RCR21,
-        ExtaLifeDeviceModel.RCZ21: ExtaLifeDeviceModelName.RCZ21,
-        ExtaLifeDeviceModel.SLN21: ExtaLifeDeviceModelName.SLN21,
-        ExtaLifeDeviceModel.SLN22: ExtaLifeDeviceModelName.SLN22,
-        ExtaLifeDeviceModel.RCK21: ExtaLifeDeviceModelName.RCK21,
-        ExtaLifeDeviceModel.ROB21: ExtaLifeDeviceModelName.ROB21,
-        ExtaLifeDeviceModel.P501: ExtaLifeDeviceModelName.P501,
-        ExtaLifeDeviceModel.P520: ExtaLifeDeviceModelName.P520,
-        ExtaLifeDeviceModel.P521L: ExtaLifeDeviceModelName.P521L,
-        ExtaLifeDeviceModel.RCW21: ExtaLifeDeviceModelName.RCW21,
-        ExtaLifeDeviceModel.REP21: ExtaLifeDeviceModelName.REP21,
-        ExtaLifeDeviceModel.BULIK_DRS985: ExtaLifeDeviceModelName.BULIK_DRS985,
-
-        # Exta Free
-        ExtaLifeDeviceModel.ROP01: ExtaLifeDeviceModelName.ROP01,
-        ExtaLifeDeviceModel.ROP02: ExtaLifeDeviceModelName.ROP02,
-        ExtaLifeDeviceModel.ROM01: ExtaLifeDeviceModelName.ROM01,
-        ExtaLifeDeviceModel.ROM10: ExtaLifeDeviceModelName.ROM10,
-        ExtaLifeDeviceModel.ROP05: ExtaLifeDeviceModelName.ROP05,
-        ExtaLifeDeviceModel.ROP06: ExtaLifeDeviceModelName.ROP06,
-        ExtaLifeDeviceModel.ROP07: ExtaLifeDeviceModelName.ROP07,
-        ExtaLifeDeviceModel.RWG01: ExtaLifeDeviceModelName.RWG01,
-        ExtaLifeDeviceModel.ROB01: ExtaLifeDeviceModelName.ROB01,
-        ExtaLifeDeviceModel.SRP02: ExtaLifeDeviceModelName.SRP02,
-        ExtaLifeDeviceModel.RDP01: ExtaLifeDeviceModelName.RDP01,
-        ExtaLifeDeviceModel.RDP02: ExtaLifeDeviceModelName.RDP02,
-        ExtaLifeDeviceModel.RDP11: ExtaLifeDeviceModelName.RDP11,
-        ExtaLifeDeviceModel.SRP03: ExtaLifeDeviceModelName.SRP03,
+        device_model: ExtaLifeDeviceModelName[device_model.name] for device_model in ExtaLifeDeviceModel
     }
 
-    __MAP_MODEL_NAME_TO_TYPE: dict[ExtaLifeDeviceModelName, ExtaLifeDeviceModel] = {
-        v: k for k, v in __MAP_TYPE_TO_MODEL_NAME.items()
-    }
+    # same mapping as list directly indexed by device type (types 0..max, gaps are None)
+    __LIST_TYPE_TO_MODEL_NAME: list[ExtaLifeDeviceModelName | None] = list(
+        map(__MAP_TYPE_TO_MODEL_NAME.get, range(max(__MAP_TYPE_TO_MODEL_NAME) + 1))
+    )
+
+    __MAP_MODEL_NAME_TO_TYPE: dict[ExtaLifeDeviceModelName, ExtaLifeDeviceModel] = dict(
+        zip(__MAP_TYPE_TO_MODEL_NAME.values(), __MAP_TYPE_TO_MODEL_NAME.keys())
+    )
 
     __MAP_ACTION_TO_STATE: dict = {
 
@@ -305,12 +297,14 @@ class ExtaLifeMap:
     }
 
     @classmethod
-    def type_to_model_name(cls, device_type: ExtaLifeDeviceModel) -> ExtaLifeDeviceModelName:
+    def type_to_model_name(cls, device_type: ExtaLifeDeviceModel) -> ExtaLifeDeviceModelName | str:
 
-        if device_type in cls.__MAP_TYPE_TO_MODEL_NAME:
-            return cls.__MAP_TYPE_TO_MODEL_NAME.get(device_type)
+        model_names = cls.__LIST_TYPE_TO_MODEL_NAME
+        if 0 <= device_type < len(model_names) and (model_name := model_names[device_type]) is not None:
+            return model_name
 
-        return ExtaLifeDeviceModelName(f"unknown device model ({device_type})")
+        # plain string, it is not a member of ExtaLifeDeviceModelName
+        return f"unknown device model ({device_type})"
 
     @classmethod
     def model_name_to_type(cls, model_name: ExtaLifeDeviceModelName) -> ExtaLifeDeviceModel:
@@ -421,112 +415,118 @@ class ExtaLifeResponseStatus(StrEnum):
     PROGRESS = "progress"
 
 
+# raw value to enum member lookups, used on hot paths to avoid calling enum class for each message
+_CMD_BY_VALUE: dict[int, ExtaLifeCmd] = {cmd.value: cmd for cmd in ExtaLifeCmd}
+_STATUS_BY_VALUE: dict[str, ExtaLifeResponseStatus] = {status.value: status for status in ExtaLifeResponseStatus}
+_ERR_BY_VALUE: dict[int, ExtaLifeCmdErrorCode] = {err.value: err for err in ExtaLifeCmdErrorCode}
+
+
 # Exta Life devices
-DEVICE_ARR_SENS_TEMP = [
+DEVICE_ARR_SENS_TEMP = (
     ExtaLifeDeviceModel.RNK22_TEMP_SENSOR,
     ExtaLifeDeviceModel.RNK24_TEMP_SENSOR,
     ExtaLifeDeviceModel.RCT21,
-    ExtaLifeDeviceModel.RCT22
-]
+    ExtaLifeDeviceModel.RCT22,
+)
 
-DEVICE_ARR_SENS_LIGHT = []
-DEVICE_ARR_SENS_HUMID = []
-DEVICE_ARR_SENS_PRESSURE = []
+DEVICE_ARR_SENS_LIGHT = ()
+DEVICE_ARR_SENS_HUMID = ()
+DEVICE_ARR_SENS_PRESSURE = ()
 
-DEVICE_ARR_SENS_WIND = [
-    ExtaLifeDeviceModel.RCW21
-]
+DEVICE_ARR_SENS_WIND = (
+    ExtaLifeDeviceModel.RCW21,
+)
 
-DEVICE_ARR_SENS_MULTI = [
-    ExtaLifeDeviceModel.RCM21
-]
+DEVICE_ARR_SENS_MULTI = (
+    ExtaLifeDeviceModel.RCM21,
+)
 
-DEVICE_ARR_SENS_WATER = [
-    ExtaLifeDeviceModel.RCZ21
-]
+DEVICE_ARR_SENS_WATER = (
+    ExtaLifeDeviceModel.RCZ21,
+)
 
-DEVICE_ARR_SENS_MOTION = [
-    ExtaLifeDeviceModel.RCR21
-]
+DEVICE_ARR_SENS_MOTION = (
+    ExtaLifeDeviceModel.RCR21,
+)
 
-DEVICE_ARR_SENS_OPEN_CLOSE = [
-    ExtaLifeDeviceModel.RCK21
-]
+DEVICE_ARR_SENS_OPEN_CLOSE = (
+    ExtaLifeDeviceModel.RCK21,
+)
 
-DEVICE_ARR_SENS_ENERGY_METER = [
-    ExtaLifeDeviceModel.MEM21
-]
+DEVICE_ARR_SENS_ENERGY_METER = (
+    ExtaLifeDeviceModel.MEM21,
+)
 
-DEVICE_ARR_SENS_GATE_CONTROLLER = [
-    ExtaLifeDeviceModel.ROB21
-]
+DEVICE_ARR_SENS_GATE_CONTROLLER = (
+    ExtaLifeDeviceModel.ROB21,
+)
 
-DEVICE_ARR_SWITCH = [
+DEVICE_ARR_SWITCH = (
     ExtaLifeDeviceModel.ROP21,
     ExtaLifeDeviceModel.ROP22,
     ExtaLifeDeviceModel.ROG21,
     ExtaLifeDeviceModel.ROM22,
-    ExtaLifeDeviceModel.ROM24
-]
-DEVICE_ARR_COVER = [
+    ExtaLifeDeviceModel.ROM24,
+)
+DEVICE_ARR_COVER = (
     ExtaLifeDeviceModel.SRP22,
-    ExtaLifeDeviceModel.SRM22
-]
-DEVICE_ARR_LIGHT = [
+    ExtaLifeDeviceModel.SRM22,
+)
+DEVICE_ARR_LIGHT = (
     ExtaLifeDeviceModel.RDP21,
     ExtaLifeDeviceModel.SLR21,
     ExtaLifeDeviceModel.SLN21,
     ExtaLifeDeviceModel.SLR22,
-    ExtaLifeDeviceModel.SLN22
-]
+    ExtaLifeDeviceModel.SLN22,
+)
 
-DEVICE_ARR_LIGHT_RGB = []  # RGB only
+DEVICE_ARR_LIGHT_RGB = ()  # RGB only
 
-DEVICE_ARR_LIGHT_RGBW = [
+DEVICE_ARR_LIGHT_RGBW = (
     ExtaLifeDeviceModel.SLR22,
-    ExtaLifeDeviceModel.SLN22
-]
+    ExtaLifeDeviceModel.SLN22,
+)
 
-DEVICE_ARR_LIGHT_EFFECT = [
+DEVICE_ARR_LIGHT_EFFECT = (
     ExtaLifeDeviceModel.SLR22,
-    ExtaLifeDeviceModel.SLN22
-]
+    ExtaLifeDeviceModel.SLN22,
+)
 
-DEVICE_ARR_CLIMATE = [
-    ExtaLifeDeviceModel.RGT01
-]
+DEVICE_ARR_CLIMATE = (
+    ExtaLifeDeviceModel.RGT01,
+)
 
-DEVICE_ARR_REPEATER = [
-    ExtaLifeDeviceModel.REP21
-]
+DEVICE_ARR_REPEATER = (
+    ExtaLifeDeviceModel.REP21,
+)
 
-DEVICE_ARR_TRANS_REMOTE = [
+DEVICE_ARR_TRANS_REMOTE = (
     ExtaLifeDeviceModel.P4572,
     ExtaLifeDeviceModel.P4574,
     ExtaLifeDeviceModel.P4578,
     ExtaLifeDeviceModel.P45736,
     ExtaLifeDeviceModel.P501,
     ExtaLifeDeviceModel.P520,
-    ExtaLifeDeviceModel.P521L
-]
+    ExtaLifeDeviceModel.P521L,
+)
 
-DEVICE_ARR_TRANS_NORMAL_BATTERY = [
+DEVICE_ARR_TRANS_NORMAL_BATTERY = (
     ExtaLifeDeviceModel.RNK22,
     ExtaLifeDeviceModel.RNK24,
-    ExtaLifeDeviceModel.RNP22
-]
+    ExtaLifeDeviceModel.RNP22,
+)
 
-DEVICE_ARR_TRANS_NORMAL_MAINS = [
+DEVICE_ARR_TRANS_NORMAL_MAINS = (
     ExtaLifeDeviceModel.RNM24,
-    ExtaLifeDeviceModel.RNP21
-]
+    ExtaLifeDeviceModel.RNP21,
+)
 
 # Exta Free devices
-DEVICE_ARR_EXTA_FREE_RECEIVER = [
-    80
-]
+DEVICE_ARR_EXTA_FREE_RECEIVER = (
+    80,
+)
 
-DEVICE_ARR_EXTA_FREE_SWITCH = [
+DEVICE_ARR_EXTA_FREE_SWITCH = (
     ExtaLifeDeviceModel.ROP01,
     ExtaLifeDeviceModel.ROP02,
     ExtaLifeDeviceModel.ROM01,
@@ -536,83 +536,83 @@ DEVICE_ARR_EXTA_FREE_SWITCH = [
     ExtaLifeDeviceModel.ROP07,
     ExtaLifeDeviceModel.RWG01,
     ExtaLifeDeviceModel.ROB01,
-]
+)
 
-DEVICE_ARR_EXTA_FREE_COVER = [
+DEVICE_ARR_EXTA_FREE_COVER = (
     ExtaLifeDeviceModel.SRP02,
-    ExtaLifeDeviceModel.SRP03
-]
+    ExtaLifeDeviceModel.SRP03,
+)
 
-DEVICE_ARR_EXTA_FREE_LIGHT = [
+DEVICE_ARR_EXTA_FREE_LIGHT = (
     ExtaLifeDeviceModel.RDP01,
-    ExtaLifeDeviceModel.RDP02
-]
+    ExtaLifeDeviceModel.RDP02,
+)
 
-DEVICE_ARR_EXTA_FREE_RGB = [
-    ExtaLifeDeviceModel.RDP11
-]
+DEVICE_ARR_EXTA_FREE_RGB = (
+    ExtaLifeDeviceModel.RDP11,
+)
 
-DEVICE_ARR_ALL_EXTA_FREE_SWITCH = [*DEVICE_ARR_EXTA_FREE_SWITCH]
-DEVICE_ARR_ALL_EXTA_FREE_LIGHT = [*DEVICE_ARR_EXTA_FREE_LIGHT, *DEVICE_ARR_EXTA_FREE_RGB]
-DEVICE_ARR_ALL_EXTA_FREE_COVER = [*DEVICE_ARR_EXTA_FREE_COVER]
+DEVICE_ARR_ALL_EXTA_FREE_SWITCH = frozenset(DEVICE_ARR_EXTA_FREE_SWITCH)
+DEVICE_ARR_ALL_EXTA_FREE_LIGHT = frozenset((*DEVICE_ARR_EXTA_FREE_LIGHT, *DEVICE_ARR_EXTA_FREE_RGB))
+DEVICE_ARR_ALL_EXTA_FREE_COVER = frozenset(DEVICE_ARR_EXTA_FREE_COVER)
 
 # union of all subtypes
-DEVICE_ARR_ALL_SWITCH = [
+DEVICE_ARR_ALL_SWITCH = frozenset((
     *DEVICE_ARR_SWITCH,
-    *DEVICE_ARR_ALL_EXTA_FREE_SWITCH
-]
+    *DEVICE_ARR_ALL_EXTA_FREE_SWITCH,
+))
 
-DEVICE_ARR_ALL_LIGHT = [
+DEVICE_ARR_ALL_LIGHT = frozenset((
     *DEVICE_ARR_LIGHT,
     *DEVICE_ARR_LIGHT_RGB,
     *DEVICE_ARR_LIGHT_RGBW,
     *DEVICE_ARR_ALL_EXTA_FREE_LIGHT,
-]
+))
 
-DEVICE_ARR_ALL_COVER = [
+DEVICE_ARR_ALL_COVER = frozenset((
     *DEVICE_ARR_COVER,
     *DEVICE_ARR_SENS_GATE_CONTROLLER,
-    *DEVICE_ARR_ALL_EXTA_FREE_COVER
-]
+    *DEVICE_ARR_ALL_EXTA_FREE_COVER,
+))
 
-DEVICE_ARR_ALL_CLIMATE = [
-    *DEVICE_ARR_CLIMATE
-]
+DEVICE_ARR_ALL_CLIMATE = frozenset((
+    *DEVICE_ARR_CLIMATE,
+))
 
-DEVICE_ARR_ALL_TRANSMITTER = [
+DEVICE_ARR_ALL_TRANSMITTER = frozenset((
     *DEVICE_ARR_TRANS_REMOTE,
     *DEVICE_ARR_TRANS_NORMAL_BATTERY,
-    *DEVICE_ARR_TRANS_NORMAL_MAINS
-]
+    *DEVICE_ARR_TRANS_NORMAL_MAINS,
+))
 
-DEVICE_ARR_ALL_IGNORE = [
-    *DEVICE_ARR_REPEATER
-]
+DEVICE_ARR_ALL_IGNORE = frozenset((
+    *DEVICE_ARR_REPEATER,
+))
 
 # measurable magnitude/quantity:
-DEVICE_ARR_ALL_SENSOR_MEAS = [
+DEVICE_ARR_ALL_SENSOR_MEAS = frozenset((
     *DEVICE_ARR_SENS_TEMP,
     *DEVICE_ARR_SENS_HUMID,
-    *DEVICE_ARR_SENS_ENERGY_METER
-]
+    *DEVICE_ARR_SENS_ENERGY_METER,
+))
 
 # binary sensors:
-DEVICE_ARR_ALL_SENSOR_BINARY = [
+DEVICE_ARR_ALL_SENSOR_BINARY = frozenset((
     *DEVICE_ARR_SENS_WATER,
     *DEVICE_ARR_SENS_MOTION,
     *DEVICE_ARR_SENS_OPEN_CLOSE,
-]
+))
 
-DEVICE_ARR_ALL_SENSOR_MULTI = [
+DEVICE_ARR_ALL_SENSOR_MULTI = frozenset((
     *DEVICE_ARR_SENS_MULTI,
     *DEVICE_ARR_SENS_WIND,
-]
+))
 
-DEVICE_ARR_ALL_SENSOR = [
+DEVICE_ARR_ALL_SENSOR = frozenset((
     *DEVICE_ARR_ALL_SENSOR_MEAS,
     *DEVICE_ARR_ALL_SENSOR_BINARY,
     *DEVICE_ARR_ALL_SENSOR_MULTI,
-]
+))
 
 # list of device types mapped into `light` platform in HA
 # override device and type rules based on icon; force 'light' device for some icons,
@@ -644,14 +644,14 @@ class ExtaLifeRequest(ExtaLifeMessage):
 
         self._data: ExtaLifeData = data if data else {}
 
-    def to_json(self) -> str:
-        return json.dumps({"command": self.command, "data": self._data})
-
-    def to_string(self) -> str:
-        return str(self.to_json()) if self.command != ExtaLifeCmd.NOOP else " "
+    def to_frame(self) -> tuple[bytes, bytes]:
+        """Return request payload and frame terminator as separate parts to be written without joining"""
+        if self.command == ExtaLifeCmd.NOOP:
+            return b" ", b"\x03"
+        return _json_dumpb({"command": self.command, "data": self._data}), b"\x03"
 
     def to_bytes(self) -> bytes:
-        return (self.to_string() + chr(3)).encode()
+        return b"".join(self.to_frame())
 
 
 class ExtaLifeResponse(ExtaLifeMessage):
@@ -662,35 +662,38 @@ class ExtaLifeResponse(ExtaLifeMessage):
         raise KeyError()
 
     @staticmethod
-    def fix_keys(response: str) -> str:
+    def fix_keys(response: str | bytes) -> str | bytes:
         """Dirty hack to replace some of the keys in response from EFC controller"""
 
         # for find, replace in {"synch": "sync_time", "last_synch": "last_sync"}.items():
         #     response = response
         return response
 
-    def __init__(self, response: str | list[ExtaLifeResponseType], request: ExtaLifeRequest | None = None):
+    def __init__(self, response: str | bytes | list[ExtaLifeResponseType], request: ExtaLifeRequest | None = None):
 
         self._request: ExtaLifeRequest | None = request
         self._data: ExtaLifeDataList = []
 
-        if isinstance(response, str):
-            # convert to list
-            response_data: dict[str, Any] = json.loads(self.fix_keys(response))
-            super().__init__(ExtaLifeCmd(response_data.get("command")))
-            self._status: ExtaLifeResponseStatus = ExtaLifeResponseStatus(response_data.get("status"))
-            if self.command == ExtaLifeCmd.DOWNLOAD_BACKUP:
-                response_data.pop("command")
-                response_data.pop("status")
+        if isinstance(response, (str, bytes)):
+            # convert to list, JSON is parsed straight from raw frame if bytes were given
+            response_data: dict[str, Any] = _json_loads(self.fix_keys(response))
+            command_value = response_data.get("command")
+            status_value = response_data.get("status")
+            command = _CMD_BY_VALUE.get(command_value)
+            status = _STATUS_BY_VALUE.get(status_value)
+            super().__init__(command if command is not None else ExtaLifeCmd(command_value))
+            self._status: ExtaLifeResponseStatus = (
+                status if status is not None else ExtaLifeResponseStatus(status_value)
+            )
+            if command is ExtaLifeCmd.DOWNLOAD_BACKUP:
+                del response_data["command"], response_data["status"]
                 self._data.append(response_data)
             else:
                 self._data.append(response_data.get("data"))
         else:
             super().__init__(response[-1].command)
             self._status: ExtaLifeResponseStatus = response[-1].status
-            for x in range(0, len(response)):
-                for data_item in response[x]._data:
-                    self._data.append(data_item)
+            self._data = [data_item for partial in response for data_item in partial._data]
 
     @property
     def request(self) -> ExtaLifeRequest | None:
@@ -710,8 +713,13 @@ class ExtaLifeResponse(ExtaLifeMessage):
 
     @property
     def error_code(self) -> ExtaLifeCmdErrorCode:
-        if self.status == ExtaLifeResponseStatus.FAILURE and self.length > 0:
-            return ExtaLifeCmdErrorCode(int(self.data[0]["code"]))
+        if self._status == ExtaLifeResponseStatus.FAILURE:
+            error = self._data[0] if self._data else None
+            if isinstance(error, dict) and error.get("code") is not None:
+                # codes not known to this library are reported as UNKNOWN instead of raising ValueError
+                return _ERR_BY_VALUE.get(int(error["code"]), ExtaLifeCmdErrorCode.UNKNOWN)
+            # failure reported without (valid) error details
+            return ExtaLifeCmdErrorCode.UNKNOWN
         return ExtaLifeCmdErrorCode.SUCCESS
 
     @property
@@ -725,9 +733,22 @@ except ImportError:
     FAKE_RECEIVERS = FAKE_SENSORS = FAKE_TRANSMITTERS = []
 
 
+@functools.lru_cache(maxsize=512)
+def _parse_channel_id(channel_id: str) -> Tuple[int, int]:
+    """Split API channel id e.g. '1-1' into device id and channel number"""
+    dev_id, channel = channel_id.split("-", 1)
+    return int(dev_id), int(channel)
+
+
 class ExtaLifeAPI:
     """ Main API class: wrapper for communication with controller """
 
+    __slots__ = (
+        "_mac", "_mac_cache", "_name", "_on_connect_callback", "_on_disconnect_callback", "_on_notification_callback",
+        "_loop", "_host", "_port", "_username", "_password", "_connection", "_network", "_version",
+        "_reconnect_task", "_conn_event_handlers",
+    )
+
     # Actions
 
     # Channel Types
@@ -742,12 +763,15 @@ class ExtaLifeAPI:
     def is_debugger_active(cls) -> bool:
         """Return if the debugger is currently active"""
 
-        if cls._debugger is None:
-            cls._debugger = hasattr(sys, "get""trace") and sys.gettrace() is not None
-            if not cls._debugger:
-                debugger_tool = sys.monitoring.get_tool(sys.monitoring.DEBUGGER_ID)
-                cls._debugger = debugger_tool is not None and debugger_tool != ""
+        if cls._debugger is not None:
+            return cls._debugger
+
+        debugger = hasattr(sys, "get""trace") and sys.gettrace() is not None
+        if not debugger and (monitoring := getattr(sys, "monitoring", None)) is not None:
+            debugger_tool = monitoring.get_tool(monitoring.DEBUGGER_ID)
+            debugger = debugger_tool is not None and debugger_tool != ""
 
+        cls._debugger = bool(debugger)
         return cls._debugger
 
     @classmethod
@@ -755,6 +779,11 @@ class ExtaLifeAPI:
         """ Returns controller IP address if found, otherwise None"""
         return ExtaLifeConn.discover_controller()
 
+    @classmethod
+    async def async_discover_controller(cls, loop: AbstractEventLoop) -> str:
+        """ Returns controller IP address if found, otherwise empty string; does not block event loop"""
+        return await ExtaLifeConn.async_discover_controller(loop)
+
     def __init__(self, loop: AbstractEventLoop | None = None,
                  on_connect_callback: Callable[[], Awaitable] | None = None,
                  on_disconnect_callback: Callable[[], Awaitable[int]] | None = None,
@@ -765,6 +794,7 @@ class ExtaLifeAPI:
         on_disconnect_callback - optional callback for notifications when API loses connection to the controller """
 
         self._mac: str | None = None
+        self._mac_cache: dict[str, str] = {}
         self._name: str | None = None
 
         # set on_connect callback to notify caller
@@ -783,6 +813,13 @@ class ExtaLifeAPI:
         self._version: dict[str, Any] = self._create_version_info()
         self._reconnect_task: Task | None = None
 
+        # connection events dispatch table, notifications are the most frequent ones
+        self._conn_event_handlers: dict[ExtaLifeEvent, Callable[[ExtaLifeConnType, Any], Awaitable]] = {
+            ExtaLifeEvent.NOTIFICATION: self._async_do_conn_notification,
+            ExtaLifeEvent.CONNECTED: self._async_do_conn_connected,
+            ExtaLifeEvent.DISCONNECTED: self._async_do_conn_disconnected,
+        }
+
     @staticmethod
     def _config_backup_rotate(backup_path: str, backup_prefix: str, backup_retention: int) -> None:
         # TODO: Missing one-liner
@@ -808,9 +845,8 @@ class ExtaLifeAPI:
 
         if backup_retention and (entries_len - backup_retention > 0):
 
-            _LOGGER.debug(f"ConfigRotate: Requested rotation to {backup_retention} entries. "
-                          f"Found {entries_len} entries. Total {backup_files_count} file(s) of "
-                          f"size {backup_files_size} byte(s)")
+            _LOGGER.debug("ConfigRotate: Requested rotation to %d entries. Found %d entries. Total %d file(s) of "
+                          "size %d byte(s)", backup_retention, entries_len, backup_files_count, backup_files_size)
 
             for index in range(0, entries_len):
                 entry = entries[index]
@@ -825,12 +861,12 @@ class ExtaLifeAPI:
                             _LOGGER.warning(f"ConfigRotate: Failed to remove '{backup_file.name}', {err}")
                             continue
 
-            _LOGGER.debug(f"ConfigRotate: Removed {entries_len - backup_retention} entries. Total "
-                          f"{backup_deleted_count} files of size {backup_deleted_size} byte(s) has been deleted")
+            _LOGGER.debug("ConfigRotate: Removed %d entries. Total %d files of size %d byte(s) has been deleted",
+                          entries_len - backup_retention, backup_deleted_count, backup_deleted_size)
 
-        _LOGGER.debug(f"ConfigRotate: Backup contains {min(entries_len, backup_retention)} entries. Total "
-                      f"{backup_files_count - backup_deleted_count} file(s) of size "
-                      f"{backup_files_size - backup_deleted_size} byte(s)")
+        _LOGGER.debug("ConfigRotate: Backup contains %s entries. Total %d file(s) of size %d byte(s)",
+                      min(entries_len, backup_retention), backup_files_count - backup_deleted_count,
+                      backup_files_size - backup_deleted_size)
 
     @staticmethod
     def _create_network_info(ip_address: str = "",
@@ -859,12 +895,12 @@ class ExtaLifeAPI:
         }
 
     @staticmethod
-    def _transform_channels(data_list: ExtaLifeDataList, dummy_channel: bool = False) -> list[dict[str, any]]:
+    def _iter_channels(data_list: ExtaLifeDataList, dummy_channel: bool = False) -> Iterator[dict[str, Any]]:
         """
         data_js - list of TCP command data in JSON dict
         dummy_channel - dummy channel number? For Transmitters there is no channel info. Make it # per device
 
-        The method will transform TCP JSON into list of channels.
+        The method will transform TCP JSON into channels, yielded one by one.
         Each channel will look like rephrased TCP JSON and will consist of attributes
         of the "state" section (channel) + attributes of the "device" section
         e.g.:
@@ -913,25 +949,26 @@ class ExtaLifeAPI:
         """
 
         def_channel = "#" if dummy_channel else None
-        channels = []  # list of JSON dicts
         for data in data_list:
             for device in data["devices"]:
-                dev = device.copy()
+                states = device["state"]
+                dev = {key: value for key, value in device.items() if key != "state"}
 
                 if dev.get("exta_free_device") is True:
                     # do the same as the Exta Life app does - add 300 to move identifiers to Exta Life "namespace"
-                    dev["type"] = int(dev["state"][0]["exta_free_type"]) + 300
+                    dev["type"] = int(states[0]["exta_free_type"]) + 300
 
-                dev.pop("state")
-                for state in device["state"]:
+                id_prefix = f"{device["id"]}-"
+                for state in states:
                     # ch_no = state.get("channel", def_channel) if def_channel else state["channel"]
-                    channel = {
+                    # device attributes take precedence over channel (state) ones
+                    channel_data = state.copy()
+                    channel_data.update(dev)
+                    yield {
                         # API channel, not TCP channel
-                        "id": str(device["id"]) + "-" + str(state.get("channel", def_channel)),
-                        "data": {**state, **dev}
+                        "id": f"{id_prefix}{state.get("channel", def_channel)}",
+                        "data": channel_data
                     }
-                    channels.append(channel)
-        return channels
 
     def _config_backup_get_schedule_name(self, ident: str = "", schedule: str = ""):
         # TODO: Missing one-liner
@@ -962,7 +999,7 @@ class ExtaLifeAPI:
                     continue
         return
 
-    async def _async_do_conn_connected(self, sender: ExtaLifeConnType) -> None:
+    async def _async_do_conn_connected(self, sender: ExtaLifeConnType, data: Any = None) -> None:
         """ Called when connectivity is (re)established and logged on successfully """
 
         if self._reconnect_task:
@@ -970,7 +1007,7 @@ class ExtaLifeAPI:
             try:
                 await self._reconnect_task
             except AsyncCancelledError:
-                _LOGGER.debug(f"Reconnect task has been finished")
+                _LOGGER.debug("Reconnect task has been finished")
                 pass
             self._reconnect_task = None
 
@@ -978,7 +1015,6 @@ class ExtaLifeAPI:
         self._host = sender.host
         self._port = sender.port
         self._username = sender.username
-        self._password = sender.password
 
         # refresh config details
         config_details: ExtaLifeData | None = await self.async_get_config_details()
@@ -988,6 +1024,8 @@ class ExtaLifeAPI:
                 self._name = network.get("name", "")
                 mac: str = network.get("mac", "").lower()
                 self._mac = ':'.join(mac[pos:pos + 2] for pos in range(0, len(mac), 2))
+                if self._mac:
+                    self._mac_cache[self._host] = self._mac
 
             # check if network_actual exists since it is supported from fw ver 1.6.29)
             network_actual = config_details.get("network_actual")
@@ -1032,6 +1070,8 @@ class ExtaLifeAPI:
 
         self._network = self._create_network_info()
         self._version = self._create_version_info()
+        # host address may be taken over by another device before reconnect succeeds
+        self._mac_cache.pop(self._host, None)
 
     # noinspection PyUnusedLocal
     async def _async_do_conn_notification(self, sender: ExtaLifeConnType, notification: ExtaLifeResponse) -> None:
@@ -1042,18 +1082,35 @@ class ExtaLifeAPI:
             await self._on_notification_callback(notification)
 
     async def _async_do_conn_event_callback(self, sender: ExtaLifeConnType, event: ExtaLifeEvent, data: Any) -> None:
-        if event == ExtaLifeEvent.CONNECTED:
-            await self._async_do_conn_connected(sender)
-        elif event == ExtaLifeEvent.DISCONNECTED:
-            await self._async_do_conn_disconnected(sender, data)
-        elif event == ExtaLifeEvent.NOTIFICATION:
-            await self._async_do_conn_notification(sender, data)
+        handler = self._conn_event_handlers.get(event)
+        if handler is not None:
+            await handler(sender, data)
+
+    @staticmethod
+    def _get_mac_address(host: str) -> str | None:
+        """Lookup MAC address of host, read kernel ARP table directly on Linux"""
+        if sys.platform == "linux":
+            try:
+                with open("/proc/net/arp") as arp_table:
+                    next(arp_table, None)  # skip header
+                    for line in arp_table:
+                        fields = line.split()
+                        if len(fields) > 3 and fields[0] == host and fields[3] != "00:00:00:00:00:00":
+                            return fields[3]
+            except OSError:
+                pass
 
-    async def async_get_mac_address(self) -> str | None:
         from getmac import get_mac_address
-        # get EFC-01 controller MAC address
+        return get_mac_address(None, host, None, host)
 
-        return await self._loop.run_in_executor(None, get_mac_address, None, self._host, None, self._host)
+    async def async_get_mac_address(self) -> str | None:
+        # get EFC-01 controller MAC address, resolve it only once per established connection
+        mac = self._mac_cache.get(self._host)
+        if mac is None:
+            mac = await self._loop.run_in_executor(None, ExtaLifeAPI._get_mac_address, self._host)
+            if mac:
+                self._mac_cache[self._host] = mac
+        return mac
 
     async def async_post_command(self, command: ExtaLifeCmd, data: ExtaLifeData | None = None) -> None:
         # TODO: Missing one-liner
@@ -1105,7 +1162,7 @@ class ExtaLifeAPI:
 
         # init TCP adapter and try to connect
         try:
-            _LOGGER.debug(f"Connecting to controller using {"address " + host if host else "auto discovery procedure"}")
+            _LOGGER.debug("Connecting to controller using %s", "address " + host if host else "auto discovery procedure")
             connection: ExtaLifeConn = await _async_connect_tcp(host, port)
         except ExtaLifeConnError as err:
             if host and autodiscover:
@@ -1123,6 +1180,9 @@ class ExtaLifeAPI:
             await connection.async_disconnect()
             raise err
 
+        # connection does not retain password, keep it here for reconnect purposes
+        self._password = password
+
         return response[0]
 
     async def async_reconnect(self) -> None:
@@ -1186,26 +1246,41 @@ class ExtaLifeAPI:
 
         async def _async_get_channels(command: ExtaLifeCmd,
                                       dummy_channel: bool = False,
-                                      more_data: ExtaLifeDataList = None) -> None:
+                                      more_data: ExtaLifeDataList = None) -> ExtaLifeDataList:
 
             if self.is_connected:
                 response: ExtaLifeResponse = await self.async_exec_command(command)
                 if response:
                     if isinstance(more_data, list):
                         response.data.extend(more_data)
-                    channels.extend(self._transform_channels(response.data, dummy_channel))
+                    return list(self._iter_channels(response.data, dummy_channel))
+            return []
 
+        fetches = []
         if self.CHN_TYP_RECEIVERS in include:
-            await _async_get_channels(ExtaLifeCmd.FETCH_RECEIVERS, more_data=FAKE_RECEIVERS)
+            fetches.append(_async_get_channels(ExtaLifeCmd.FETCH_RECEIVERS, more_data=FAKE_RECEIVERS))
 
         if self.CHN_TYP_SENSORS in include:
-            await _async_get_channels(ExtaLifeCmd.FETCH_SENSORS, more_data=FAKE_SENSORS)
+            fetches.append(_async_get_channels(ExtaLifeCmd.FETCH_SENSORS, more_data=FAKE_SENSORS))
 
         if self.CHN_TYP_TRANSMITTERS in include:
-            await _async_get_channels(ExtaLifeCmd.FETCH_TRANSMITTERS, True, more_data=FAKE_TRANSMITTERS)
+            fetches.append(_async_get_channels(ExtaLifeCmd.FETCH_TRANSMITTERS, True, more_data=FAKE_TRANSMITTERS))
 
         if self.CHN_TYP_EXTA_FREE_RECEIVERS in include:
-            await _async_get_channels(ExtaLifeCmd.FETCH_EXTA_FREE)
+            fetches.append(_async_get_channels(ExtaLifeCmd.FETCH_EXTA_FREE))
+
+        # all fetches are queued at once, connection still executes them one by one in order of queueing
+        # (its command lock is FIFO) and next command is sent as soon as lock is released by previous one.
+        # Task group cancels remaining fetches on first failure, same as sequential execution would stop
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                tasks = [task_group.create_task(fetch) for fetch in fetches]
+        except ExceptionGroup as err:
+            _LOGGER.warning("Fetching channels from controller %s failed, partial channel list discarded", self.host)
+            raise err.exceptions[0] from None
+
+        for task in tasks:
+            channels.extend(task.result())
 
         return channels
 
@@ -1217,9 +1292,7 @@ class ExtaLifeAPI:
 
         Returns array of dicts converted from JSON or None if error occurred
         """
-        ch_id, channel = channel_id.split("-")
-        ch_id = int(ch_id)
-        channel = int(channel)
+        ch_id, channel = _parse_channel_id(channel_id)
 
         cmd: ExtaLifeCmd = ExtaLifeCmd.CONTROL_DEVICE
         cmd_data: ExtaLifeData = {
@@ -1244,7 +1317,7 @@ class ExtaLifeAPI:
             cmd_data = dict()
 
             response = await self.async_exec_command(cmd, cmd_data)
-            _LOGGER.debug(f"JSON response for command {cmd.name}: {response.status.name}")
+            _LOGGER.debug("JSON response for command %s: %s", cmd.name, response.status.name)
             if response.status == ExtaLifeResponseStatus.SUCCESS:
                 return True
 
@@ -1275,17 +1348,17 @@ class ExtaLifeAPI:
                     for backup_item in backup_data:
                         file_size += file.write(f"{json.dumps(backup_item, separators=(',', ":"))}\n")
                 size_total += file_size
-                _LOGGER.debug(f"ConfigBackup: Wrote {file_size} byte(s) into '{file_name}'")
+                _LOGGER.debug("ConfigBackup: Wrote %d byte(s) into '%s'", file_size, file_name)
 
                 file_name: str = os.path.join(path, f"{file_base}.json")
                 file_size = 0
                 with open(file_name, "w+") as file:
                     file_size += file.write(json.dumps(backup_data, indent=2))
                 size_total += file_size
-                _LOGGER.debug(f"ConfigBackup: Wrote {file_size} byte(s) into '{file_name}'")
+                _LOGGER.debug("ConfigBackup: Wrote %d byte(s) into '%s'", file_size, file_name)
 
                 self._config_backup_rotate(path, schedule_name, retention)
-                _LOGGER.debug(f"ConfigBackup: Created successfully, backup contains {size_total} byte(s)")
+                _LOGGER.debug("ConfigBackup: Created successfully, backup contains %d byte(s)", size_total)
 
             except OSError as err:
                 _LOGGER.error(f"ConfigBackup: config backup for '{file_base}' failed, {err}")
@@ -1407,6 +1480,7 @@ class ExtaLifeCmdError(ExtaLifeError):
     def __init__(self, response: ExtaLifeResponse) -> None:
         super().__init__()
         self._response = response
+        self._code = response.error_code
 
     @property
     def command(self) -> ExtaLifeCmd:
@@ -1414,17 +1488,20 @@ class ExtaLifeCmdError(ExtaLifeError):
 
     @property
     def code(self) -> ExtaLifeCmdErrorCode:
-        return self._response.error_code
+        return self._code
 
     @property
     def message(self) -> str:
-        return (f"Command '{self.command.name}' failed. "
-                f"Error code {self.code}, {self._response.error_message}")
+        code = self.code
+        return f"Command '{self.command.name}' failed. Error code {code}, {code.name}"
 
 
 class ExtaLifeConnParams:
 
+    __slots__ = ("_eventloop", "_host", "_port", "_keepalive", "_recv_buff_size", "on_event_callback")
+
     EFC01_DEFAULT_PORT = 20400
+    RECV_BUFF_SIZE = 65536
 
     @classmethod
     def get_addr(cls, host: str, port: int) -> str:
@@ -1452,12 +1529,15 @@ class ExtaLifeConnParams:
 
         return host, port
 
-    def __init__(self, host: str, port: int, eventloop: AbstractEventLoop, keepalive: float = 8):
+    def __init__(self, host: str, port: int, eventloop: AbstractEventLoop, keepalive: float = 8,
+                 recv_buff_size: int = RECV_BUFF_SIZE):
 
         self._eventloop: AbstractEventLoop = eventloop
         self._host: str = host
         self._port: int = port if (port > 0) and (port <= 65535) else self.EFC01_DEFAULT_PORT
         self._keepalive: float = keepalive
+        # initial size of buffer preallocated for incoming data, grows only for frames not fitting in
+        self._recv_buff_size: int = recv_buff_size if recv_buff_size > 0 else self.RECV_BUFF_SIZE
 
         self.on_event_callback: Callable[[ExtaLifeConnType, ExtaLifeEvent, Any], Awaitable] | None = None
 
@@ -1473,13 +1553,177 @@ class ExtaLifeConnParams:
     def keepalive(self) -> float:
         return self._keepalive
 
+    @property
+    def recv_buff_size(self) -> int:
+        return self._recv_buff_size
+
     @property
     def eventloop(self) -> AbstractEventLoop:
         return self._eventloop
 
 
+class _ExtaLifeProtocol(BufferedProtocol):
+    """Receive controller data into preallocated buffer and split it into ETX terminated frames"""
+
+    FRAME_END = 0x03
+
+    def __init__(self, eventloop: AbstractEventLoop, buff_size: int) -> None:
+
+        self._eventloop: AbstractEventLoop = eventloop
+        self._buffer: bytearray = bytearray(buff_size)
+        self._view: memoryview = memoryview(self._buffer)
+        self._start: int = 0
+        self._used: int = 0
+        self._transport: Transport | None = None
+        self._paused: bool = False
+        self._drain_waiters: deque[Future] = deque()
+        self._exc: Exception | None = None
+
+        self.frames: Queue[bytes | None] = Queue()
+
+    def connection_made(self, transport: BaseTransport) -> None:
+        self._transport = transport
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        self._exc = exc if exc else ConnectionResetError("Connection lost")
+        self._wake_drain_waiters()
+        self.frames.put_nowait(None)
+
+    def eof_received(self) -> bool | None:
+        self.frames.put_nowait(None)
+        return None
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        if self._used == len(self._buffer):
+            if self._start:
+                # incomplete frame reached end of buffer, move it to the beginning
+                remain = self._used - self._start
+                self._view[:remain] = self._view[self._start:self._used]
+                self._start = 0
+                self._used = remain
+            else:
+                # single frame does not fit into buffer, make it bigger
+                buffer = bytearray(len(self._buffer) * 2)
+                buffer[:self._used] = self._view[:self._used]
+                self._buffer = buffer
+                self._view = memoryview(buffer)
+        return self._view[self._used:]
+
+    def buffer_updated(self, nbytes: int) -> None:
+        # bytes received earlier were already scanned, look for terminator in new data only
+        scan_from = self._used
+        self._used += nbytes
+
+        start = self._start
+        while (end := self._buffer.find(self.FRAME_END, scan_from, self._used)) != -1:
+            self.frames.put_nowait(bytes(self._view[start:end]))
+            start = scan_from = end + 1
+
+        if start == self._used:
+            # no incomplete frame left, reuse buffer from the beginning
+            self._start = self._used = 0
+        else:
+            self._start = start
+
+    def pause_writing(self) -> None:
+        self._paused = True
+
+    def resume_writing(self) -> None:
+        self._paused = False
+        self._wake_drain_waiters()
+
+    def _wake_drain_waiters(self) -> None:
+        for waiter in self._drain_waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    async def drain(self) -> None:
+        if self._exc is not None:
+            raise self._exc
+        if self._transport is None or self._transport.is_closing():
+            raise ConnectionResetError("Connection lost")
+        if not self._paused:
+            return
+        # any number of writers may wait for transport buffer to be flushed
+        waiter = self._eventloop.create_future()
+        self._drain_waiters.append(waiter)
+        try:
+            await waiter
+        finally:
+            self._drain_waiters.remove(waiter)
+
+
+class _SockInfo(NamedTuple):
+    laddr: str
+    lport: int
+    raddr: str
+    rport: int
+
+
+_SOCKINFO_NONE = _SockInfo("", -1, "", -1)
+
+# raw values of controller broadcast frame used by autodiscovery
+_BROADCAST_STATUS: str = ExtaLifeResponseStatus.BROADCAST.value
+_BROADCAST_COMMAND: int = ExtaLifeCmd.NOOP.value
+
+
+def _is_controller_broadcast(data: bytes) -> bool:
+    """Check if multicast datagram is controller announcement, tolerating frame terminator and foreign traffic"""
+    try:
+        message = _json_loads(data.rstrip(b"\x03"))
+    except ValueError:
+        return False
+    return (
+        isinstance(message, dict)
+        and message.get("status") == _BROADCAST_STATUS
+        and message.get("command") == _BROADCAST_COMMAND
+    )
+
+
+class _ResponseWaiter:
+    """Response handler collecting all responses to single request until it is completed"""
+
+    __slots__ = ("_eventloop", "future", "responses", "last_response")
+
+    def __init__(self, eventloop: AbstractEventLoop) -> None:
+        self._eventloop: AbstractEventLoop = eventloop
+        self.future: Future[list[ExtaLifeResponse]] = eventloop.create_future()
+        self.responses: list[ExtaLifeResponse] = []
+        self.last_response: float = eventloop.time()
+
+    def renew(self) -> None:
+        """Replace future cancelled by timed out wait"""
+        self.future = self._eventloop.create_future()
+
+    def __call__(self, response: ExtaLifeResponse) -> None:
+
+        if self.future.done():
+            return
+
+        status = response.status
+        if status == ExtaLifeResponseStatus.NOTIFICATION:
+            self.last_response = self._eventloop.time()
+
+        elif status in (ExtaLifeResponseStatus.SEARCHING,
+                        ExtaLifeResponseStatus.PARTIAL,
+                        ExtaLifeResponseStatus.PROGRESS):
+            self.last_response = self._eventloop.time()
+            self.responses.append(response)
+
+        elif status in (ExtaLifeResponseStatus.SUCCESS, ExtaLifeResponseStatus.FAILURE):
+            self.responses.append(response)
+            self.future.set_result(self.responses)
+
+
 class ExtaLifeConn:
 
+    __slots__ = (
+        "_eventloop", "_host", "_port", "_sockinfo", "_keepalive", "_recv_buff_size", "_on_event_callback",
+        "_username", "_authenticated", "_connected", "_tcp_transport", "_tcp_protocol", "_close_lock", "_cmd_exec_lock",
+        "_socket", "_ping_handle", "_ping_task", "_read_task", "_tcp_last_read", "_tcp_last_write", "_tx_queue", "_tx_handle",
+        "_response_handlers",
+    )
+
     class CloseSource(StrEnum):
         CONNECT = "connect"
         CONN_TASK = "conn_task"
@@ -1488,37 +1732,39 @@ class ExtaLifeConn:
         READ_TASK = "read_task"
         REQUEST = "request"
 
-    TCP_BUFF_SIZE = 8192
-
     def __init__(self, params: ExtaLifeConnParams) -> None:
 
         self._eventloop: AbstractEventLoop = params.eventloop
         self._host: str = params.host
         self._port: int = params.port
 
-        self._local_addr: str = ""
-        self._local_port: int = -1
-        self._remote_addr: str = ""
-        self._remote_port: int = -1
+        self._sockinfo: _SockInfo = _SOCKINFO_NONE
         self._keepalive: float = params.keepalive
+        self._recv_buff_size: int = params.recv_buff_size
 
         self._on_event_callback: Callable[
                                      [ExtaLifeConnType, ExtaLifeEvent, Any], Awaitable
                                  ] | None = params.on_event_callback
 
         self._username: str = ""
-        self._password: str = ""
-        self._tcp_reader: StreamReader | None = None
-        self._tcp_writer: StreamWriter | None = None
-        self._write_lock: Lock = Lock()
+        self._authenticated: bool = False
+        self._connected: bool = False
+        self._tcp_transport: Transport | None = None
+        self._tcp_protocol: _ExtaLifeProtocol | None = None
+        self._close_lock: Lock = Lock()
         self._cmd_exec_lock: Lock = Lock()
         self._socket = None
+        self._ping_handle: TimerHandle | None = None
         self._ping_task: Task | None = None
         self._read_task: Task | None = None
 
-        self._tcp_last_write = datetime.now()
+        self._tcp_last_read: float = params.eventloop.time()
+        self._tcp_last_write: float = params.eventloop.time()
+        self._tx_queue: deque[bytes] = deque()
+        self._tx_handle: Handle | None = None
 
-        self._response_handlers: list[Callable[[ExtaLifeResponse], None]] = []
+        # handlers indexed by command they await response for
+        self._response_handlers: dict[ExtaLifeCmd, list[Callable[[ExtaLifeResponse], None]]] = {}
 
     @staticmethod
     def _check_success(response: ExtaLifeResponse, throw_error: bool = True) -> ExtaLifeResponse | None:
@@ -1541,15 +1787,15 @@ class ExtaLifeConn:
 
         if task:
             if task_name != close_source:
-                _LOGGER.debug(f"_task_shutdown[{self.host}:{close_source.name}] "
-                              f"task '{task_name.name}' requesting cancellation")
+                _LOGGER.debug("_task_shutdown[%s:%s] task '%s' requesting cancellation",
+                              self.host, close_source.name, task_name.name)
                 task.cancel()
 
             try:
                 await task
             except AsyncCancelledError:
-                _LOGGER.debug(f"_task_shutdown[{self.host}:{close_source.name}] "
-                              f"task '{task_name.name}' canceled")
+                _LOGGER.debug("_task_shutdown[%s:%s] task '%s' canceled",
+                              self.host, close_source.name, task_name.name)
                 pass
 
         return None
@@ -1565,56 +1811,63 @@ class ExtaLifeConn:
         if self._socket is None:
             return
 
-        _LOGGER.debug(f"_async_close[{self.host}:{close_source.name}]: closing connection")
+        _LOGGER.debug("_async_close[%s:%s]: closing connection", self.host, close_source.name)
 
+        if self._ping_handle is not None:
+            self._ping_handle.cancel()
+            self._ping_handle = None
         self._ping_task = await self._task_shutdown(ExtaLifeConn.CloseSource.PING_TASK, self._ping_task, close_source)
         self._read_task = await self._task_shutdown(ExtaLifeConn.CloseSource.READ_TASK, self._read_task, close_source)
 
-        async with self._write_lock:
+        async with self._close_lock:
             if not self._socket:
-                _LOGGER.debug(f"_async_close[{self.host}:{close_source.name}]: connection already closed")
+                _LOGGER.debug("_async_close[%s:%s]: connection already closed", self.host, close_source.name)
                 # socket could be released during awaiting on lock. if so just return
                 return
 
-            self._local_addr = ""
-            self._local_port = -1
-            self._remote_addr = ""
-            self._remote_port = -1
-
-            if self._tcp_writer:
-                self._tcp_writer.close()
-                self._tcp_writer = None
+            self._sockinfo = _SOCKINFO_NONE
+            self._authenticated = False
+            self._connected = False
 
-            self._tcp_reader = None
+            if self._tcp_transport:
+                self._flush_tx_queue()
+                self._tcp_transport.close()
+                self._tcp_transport = None
 
-            self._socket.close()
+            self._tcp_protocol = None
             self._socket = None
 
-        _LOGGER.debug(f"_async_close[{self.host}:{close_source.name}]: connection closed")
+        _LOGGER.debug("_async_close[%s:%s]: connection closed", self.host, close_source.name)
 
         should_reconnect = False if close_source == ExtaLifeConn.CloseSource.DISCONNECT else True
         await self._async_do_event(ExtaLifeEvent.DISCONNECTED, should_reconnect)
 
     async def _async_read_task(self) -> None:
 
-        _LOGGER.debug(f"_async_read_task[{self.host}]: STARTED")
+        _LOGGER.debug("_async_read_task[%s]: STARTED", self.host)
         try:
             while True:
-                response_raw: bytes = (await self._tcp_reader.readuntil(chr(3).encode()))[:-1]
-                response_str: str = response_raw.decode()
+                response_raw: bytes | None = await self._tcp_protocol.frames.get()
+                if response_raw is None:
+                    raise ExtaLifeConnError("connection closed by controller")
+                self._tcp_last_read = self._eventloop.time()
 
-                response: ExtaLifeResponse = ExtaLifeResponse(response_str)
-                _LOGGER.debug(f"<<< [Cmd={response.command.name}] {response_str}")
+                # JSON parser takes raw bytes, decoding to str is needed only for debug output
+                response: ExtaLifeResponse = ExtaLifeResponse(response_raw)
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug("<<< [Cmd=%s] %s", response.command.name, response_raw.decode(errors="replace"))
 
                 # pass only status change notifications to registered listeners
                 if response.status == ExtaLifeResponseStatus.NOTIFICATION:
                     await self._async_do_event(ExtaLifeEvent.NOTIFICATION, response)
                 # else:
-                for response_handler in self._response_handlers[:]:
-                    response_handler(response)
+                response_handlers = self._response_handlers.get(response.command)
+                if response_handlers:
+                    for response_handler in response_handlers[:]:
+                        response_handler(response)
 
         except AsyncCancelledError:
-            _LOGGER.debug(f"_async_read_task[{self.host}]: CANCELLED")
+            _LOGGER.debug("_async_read_task[%s]: CANCELLED", self.host)
             pass
 
         except Exception as err:
@@ -1623,54 +1876,78 @@ class ExtaLifeConn:
             await self._async_close(ExtaLifeConn.CloseSource.READ_TASK)
 
         finally:
-            _LOGGER.debug(f"_async_read_task[{self.host}]: FINISHED")
+            _LOGGER.debug("_async_read_task[%s]: FINISHED", self.host)
+
+    def _ping_timer(self) -> None:
+        """Keepalive timer callback, starts ping when connection has been idle long enough"""
+
+        # any traffic from or to controller keeps connection alive, ping only when idle
+        idle = self._eventloop.time() - max(self._tcp_last_read, self._tcp_last_write)
+        if idle < self._keepalive:
+            self._ping_handle = self._eventloop.call_later(self._keepalive - idle, self._ping_timer)
+        else:
+            self._ping_handle = None
+            self._ping_task = self._eventloop.create_task(self._async_ping_task(), name=f"extalife-ping[{self.host}]")
 
     async def _async_ping_task(self) -> None:
         """Perform dummy data posting to connected controller"""
 
-        _LOGGER.debug(f"_async_ping_task[{self.host}]: STARTED")
+        _LOGGER.debug("_async_ping_task[%s]: STARTED", self.host)
         try:
-            while True:
-                last_write = (datetime.now() - self._tcp_last_write).seconds
-                if last_write < self._keepalive:
-                    period = self._keepalive - last_write
-                    await asyncio.sleep(period)
-                else:
-                    await self.async_post_command(ExtaLifeCmd.NOOP)
+            await self._async_post_data(_NOOP_BYTES)
+            self._ping_task = None
+            self._ping_handle = self._eventloop.call_later(self._keepalive, self._ping_timer)
 
         except AsyncCancelledError:
-            _LOGGER.debug(f"_async_ping_task[{self.host}]: CANCELLED")
+            _LOGGER.debug("_async_ping_task[%s]: CANCELLED", self.host)
 
         except Exception as err:
+            self._ping_task = None
             _LOGGER.error(f"_async_ping_task[{self.host}]: FAILURE - error while pinging controller, {str(err)}")
             await self._async_close(ExtaLifeConn.CloseSource.PING_TASK)
 
         finally:
-            _LOGGER.debug(f"_async_ping_task[{self.host}]: FINISHED")
+            _LOGGER.debug("_async_ping_task[%s]: FINISHED", self.host)
+
+    def _flush_tx_queue(self) -> None:
+        """Write all requests queued during current loop iteration at once"""
+
+        if self._tx_handle is not None:
+            self._tx_handle.cancel()
+            self._tx_handle = None
 
-    async def _async_post_data(self, data: bytes) -> None:
+        if self._tx_queue:
+            self._tcp_transport.writelines(self._tx_queue)
+            self._tx_queue.clear()
+
+    async def _async_post_data(self, *data: bytes) -> None:
 
         if self._socket is None:
             raise ExtaLifeConnError(f"_async_post_data[{self.host}]: host is not connected")
 
+        # requests posted back-to-back are coalesced into single transport write, no locking needed
+        # as queueing does not await. Flush happens on next loop iteration, so drain below only applies
+        # backpressure from data already written by earlier posts, not from this one
+        self._tx_queue.extend(data)
+        if self._tx_handle is None:
+            self._tx_handle = self._eventloop.call_soon(self._flush_tx_queue)
+        self._tcp_last_write = self._eventloop.time()
         try:
-            async with self._write_lock:
-                self._tcp_writer.write(data)
-                self._tcp_last_write = datetime.now()
-                await self._tcp_writer.drain()
+            await self._tcp_protocol.drain()
         except OSError as err:
             await self._async_close(ExtaLifeConn.CloseSource.REQUEST)
             raise ExtaLifeConnError(f"post_data failed, {err}", err.errno) from None
 
     async def _async_post_request(self, request: ExtaLifeRequest) -> None:
 
-        request_data = request.to_bytes()
-        request_str = str(request_data)
-        if request.command == ExtaLifeCmd.LOGIN and not ExtaLifeAPI.is_debugger_active():
-            request_str = re.sub(r'"password":\s*"[^"]*"', '"password": "********"', request_str)
-        _LOGGER.debug(f">>> [Cmd={request.command.name}] {request_str}")
+        request_data, frame_end = request.to_frame()
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            request_str = request_data.decode(errors="replace")
+            if request.command == ExtaLifeCmd.LOGIN and not ExtaLifeAPI.is_debugger_active():
+                request_str = _PWD_RE.sub('"password": "********"', request_str)
+            _LOGGER.debug(">>> [Cmd=%s] %s", request.command.name, request_str)
 
-        await self._async_post_data(request_data)
+        await self._async_post_data(request_data, frame_end)
 
     async def _async_send_request(self, request: ExtaLifeRequest, timeout: float = 3.0) -> list[ExtaLifeResponse]:
         """ Send message to controller and await response """
@@ -1678,52 +1955,31 @@ class ExtaLifeConn:
         # prevent controller overloading and command loss - wait until finished (lock released)
         async with self._cmd_exec_lock:
 
-            responses: list[ExtaLifeResponse] = []
-            response_reader = self._eventloop.create_future()
-            last_response = datetime.now().timestamp()
-
-            def on_response(response: ExtaLifeResponse) -> None:
-
-                nonlocal last_response
-
-                if response_reader.done() or response.command != request.command:
-                    return
-
-                if response.status in ExtaLifeResponseStatus.NOTIFICATION:
-                    last_response = datetime.now().timestamp()
-
-                elif response.status in (ExtaLifeResponseStatus.SEARCHING,
-                                         ExtaLifeResponseStatus.PARTIAL,
-                                         ExtaLifeResponseStatus.PROGRESS):
-                    last_response = datetime.now().timestamp()
-                    responses.append(response)
-
-                elif response.status in (ExtaLifeResponseStatus.SUCCESS, ExtaLifeResponseStatus.FAILURE):
-                    responses.append(response)
-                    response_reader.set_result(responses)
-
-            self._response_handlers.append(on_response)
-            await self._async_post_request(request)
-
-            while True:
-                try:
-                    await asyncio.wait_for(response_reader, timeout)
-                    break
-
-                except AsyncTimeoutError:
-                    now_timeout = datetime.now().timestamp()
-                    if (now_timeout - last_response) - 0.3 > timeout:
-                        await self._async_close(ExtaLifeConn.CloseSource.REQUEST)
-                        raise ExtaLifeConnError("send_request failed, timeout while waiting for API response") from None
-                    else:
-                        response_reader = self._eventloop.create_future()
-
+            waiter = _ResponseWaiter(self._eventloop)
+            self._response_handlers.setdefault(request.command, []).append(waiter)
             try:
-                self._response_handlers.remove(on_response)
-            except ValueError:
-                pass
-
-            return responses
+                await self._async_post_request(request)
+
+                while True:
+                    try:
+                        await asyncio.wait_for(waiter.future, timeout)
+                        break
+
+                    except AsyncTimeoutError:
+                        now_timeout = self._eventloop.time()
+                        if (now_timeout - waiter.last_response) - 0.3 > timeout:
+                            await self._async_close(ExtaLifeConn.CloseSource.REQUEST)
+                            raise ExtaLifeConnError("send_request failed, timeout while waiting for API response") from None
+                        else:
+                            waiter.renew()
+            finally:
+                handlers = self._response_handlers.get(request.command)
+                if handlers is not None:
+                    handlers.remove(waiter)
+                    if not handlers:
+                        del self._response_handlers[request.command]
+
+            return waiter.responses
 
     async def async_post_command(self, command: ExtaLifeCmd, data: ExtaLifeData | None = None) -> None:
         await self._async_post_request(ExtaLifeRequest(command, data))
@@ -1742,42 +1998,53 @@ class ExtaLifeConn:
         if self.connected:
             raise ExtaLifeConnError("ExtaLifeConn async_connect failed, already connected")
 
-        self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self._socket.setblocking(False)
-        self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
-
         if not self._host:
             # if host is empty we should activate discovery action
-            self._host = await self._eventloop.run_in_executor(None, ExtaLifeConn.discover_controller)
+            self._host = await ExtaLifeConn.async_discover_controller(self._eventloop)
             if not self._host:
-                self._socket = None
                 raise ExtaLifeConnError("Failed to discover controller on local network")
             # if host was found we change connection port to default EFC-01 port (20400)
             self._port = ExtaLifeConnParams.EFC01_DEFAULT_PORT
 
-        _LOGGER.debug(f"Trying to connect to {self.host} at port {self.port}")
         try:
-            coro = self._eventloop.sock_connect(self._socket, (self.host, self.port))
-            await asyncio.wait_for(coro, timeout)
+            # static IP configured or discovered - make sure no name resolution is attempted
+            ipaddress.ip_address(self._host)
+            addr_flags = socket.AI_NUMERICHOST
+        except ValueError:
+            addr_flags = 0
+
+        _LOGGER.debug("Trying to connect to %s at port %s", self.host, self.port)
+        try:
+            # race all resolved addresses (IPv4/IPv6) instead of trying them one by one
+            coro = self._eventloop.create_connection(
+                lambda: _ExtaLifeProtocol(self._eventloop, self._recv_buff_size), self.host, self.port,
+                flags=addr_flags, happy_eyeballs_delay=0.25, interleave=1
+            )
+            self._tcp_transport, self._tcp_protocol = await asyncio.wait_for(coro, timeout)
 
         except TimeoutError as err:
-            await self._async_close(ExtaLifeConn.CloseSource.CONNECT)
             raise ExtaLifeConnError(f"Unable to connect {self.host}, connection timed out") from err
 
         except OSError as err:
-            await self._async_close(ExtaLifeConn.CloseSource.CONNECT)
             raise ExtaLifeConnError(f"Unable to connect {self.host}, connection refused") from err
 
-        self._local_addr, self._local_port = self._socket.getsockname()
-        self._remote_addr, self._remote_port = self._socket.getpeername()
-
-        self._tcp_reader, self._tcp_writer = await asyncio.open_connection(sock=self._socket)
+        # transport owns the socket (TCP_NODELAY is set by asyncio), keep it for connection state only
+        self._socket = self._tcp_transport.get_extra_info("socket")
+        try:
+            self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            for option, value in _TCP_KEEPALIVE_OPTS:
+                self._socket.setsockopt(socket.IPPROTO_TCP, option, value)
+        except OSError as err:
+            _LOGGER.debug("async_connect[%s] unable to tune socket options, %s", self.host, err)
+        self._sockinfo = _SockInfo(*self._socket.getsockname()[:2], *self._socket.getpeername()[:2])
+        self._connected = True
 
-        self._read_task = self._eventloop.create_task(self._async_read_task())
-        self._ping_task = self._eventloop.create_task(self._async_ping_task())
+        self._read_task = self._eventloop.create_task(self._async_read_task(), name=f"extalife-read[{self.host}]")
+        if self._keepalive > 0:
+            self._ping_handle = self._eventloop.call_later(self._keepalive, self._ping_timer)
 
-        _LOGGER.debug(f"async_connect[{self.host}] successfully connected ({self._local_addr}:{self._local_port} <==> "
-                      f"{self._remote_addr}:{self._remote_port})")
+        _LOGGER.debug("async_connect[%s] successfully connected (%s:%s <==> %s:%s)", self.host,
+                      *self._sockinfo)
 
     async def async_login(self, username: str, password: str) -> ExtaLifeResponse | None:
         """
@@ -1790,16 +2057,17 @@ class ExtaLifeConn:
         if self.authenticated:
             raise ExtaLifeConnError("async_login, user already logged in")
 
-        pwd = password if ExtaLifeAPI.is_debugger_active() else "*" * len(password)
-        _LOGGER.debug(f"logging in... [user: '{username}', password: '{pwd}']")
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            pwd = password if ExtaLifeAPI.is_debugger_active() else "*" * len(password)
+            _LOGGER.debug("logging in... [user: %r, password: %r]", username, pwd)
 
         cmd_data = {"password": password, "login": username}
 
         response = self._check_success(await self.async_exec_command(ExtaLifeCmd.LOGIN, cmd_data))
 
-        _LOGGER.debug(f"user '{username}' authenticated")
+        _LOGGER.debug("user '%s' authenticated", username)
         self._username = username
-        self._password = password
+        self._authenticated = True
 
         await self._async_do_event(ExtaLifeEvent.CONNECTED, self)
 
@@ -1810,11 +2078,11 @@ class ExtaLifeConn:
 
     @property
     def authenticated(self) -> bool:
-        return self._username != ""
+        return self._authenticated
 
     @property
     def connected(self) -> bool:
-        return self._socket is not None
+        return self._connected
 
     @property
     def host(self) -> str:
@@ -1830,36 +2098,31 @@ class ExtaLifeConn:
 
     @property
     def password(self) -> str:
-        return self._password
+        # password is not retained after login
+        return "********"
 
     @property
     def local_addr(self) -> str:
-        return self._local_addr
+        return self._sockinfo.laddr
 
     @property
     def local_port(self) -> int:
-        return self._local_port
+        return self._sockinfo.lport
 
     @property
     def remote_addr(self) -> str:
-        return self._remote_addr
+        return self._sockinfo.raddr
 
     @property
     def remote_port(self) -> int:
-        return self._remote_port
+        return self._sockinfo.rport
 
     @staticmethod
-    def discover_controller() -> str:
-        """
-        Perform controller autodiscovery using UDP query
-        return IP as string or false if not found
-        """
-        multicast_group: str = "225.0.0.1"
-        multicast_port: int = 20401
-        import struct
+    def _discovery_socket() -> socket.socket | None:
+        """Create socket listening for controller multicast announcements"""
 
         # sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        server_address = ("", multicast_port)
+        server_address = ("", _MCAST_PORT)
 
         # Create the socket
         sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
@@ -1869,26 +2132,62 @@ class ExtaLifeConn:
             sock.bind(server_address)
         except socket.error:
             sock.close()
-            _LOGGER.error(f"Could not connect to receive UDP multicast from EFC-01 on port {multicast_port}")
-            return ""
+            _LOGGER.error(f"Could not connect to receive UDP multicast from EFC-01 on port {_MCAST_PORT}")
+            return None
 
         # Tell the operating system to add the socket to the multicast group
         # on all interfaces (join multicast group)
-        group = socket.inet_aton(multicast_group)
-        multicast_req = struct.pack("4sL", group, socket.INADDR_ANY)
-        sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, multicast_req)
+        sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, _MCAST_REQ)
+        # do not loop back our own multicast traffic
+        sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, _MCAST_LOOP)
+        return sock
+
+    @staticmethod
+    def discover_controller() -> str:
+        """
+        Perform controller autodiscovery using UDP query
+        return IP as string or false if not found
+        """
+        sock = ExtaLifeConn._discovery_socket()
+        if sock is None:
+            return ""
 
-        sock.settimeout(3)
+        # skip unrelated datagrams until controller announces itself or time runs out
+        deadline = time.monotonic() + 3
         try:
-            (data, address) = sock.recvfrom(1024)
+            while (remaining := deadline - time.monotonic()) > 0:
+                sock.settimeout(remaining)
+                (data, address) = sock.recvfrom(1024)
+                _LOGGER.debug("Got multicast response from EFC-01: %r", data)
+                if _is_controller_broadcast(data):
+                    return address[0]  # return IP - array[0]; array[1] is sender's port
         except socket.error:
+            pass
+        finally:
             sock.close()
-            return ""
-        sock.close()
+        return ""
 
-        _LOGGER.debug("Got multicast response from EFC-01: %s", str(data.decode()))
+    @staticmethod
+    async def async_discover_controller(eventloop: AbstractEventLoop) -> str:
+        """
+        Perform controller autodiscovery using UDP query without blocking event loop
+        return IP as string or empty string if not found
+        """
+        sock = ExtaLifeConn._discovery_socket()
+        if sock is None:
+            return ""
+        sock.setblocking(False)
 
-        response = ExtaLifeResponse(data.decode())
-        if response.status == ExtaLifeResponseStatus.BROADCAST and response.command == ExtaLifeCmd.NOOP:
-            return address[0]  # return IP - array[0]; array[1] is sender's port
+        # skip unrelated datagrams until controller announces itself or time runs out
+        deadline = eventloop.time() + 3
+        try:
+            while (remaining := deadline - eventloop.time()) > 0:
+                (data, address) = await asyncio.wait_for(eventloop.sock_recvfrom(sock, 1024), remaining)
+                _LOGGER.debug("Got multicast response from EFC-01: %r", data)
+                if _is_controller_broadcast(data):
+                    return address[0]  # return IP - array[0]; array[1] is sender's port
+        except (AsyncTimeoutError, OSError):
+            pass
+        finally:
+            sock.close()
         return ""
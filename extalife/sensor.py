@@ -1,4 +1,5 @@
 """Support for Exta Life sensor devices"""
+from copy import copy
 from dataclasses import dataclass
 from datetime import (
     date,
@@ -7,6 +8,9 @@ from datetime import (
 from decimal import Decimal
 from enum import StrEnum
 import logging
+import re
+from string import punctuation
+from types import MappingProxyType
 from typing import (
     Any,
     Mapping,
@@ -51,6 +55,8 @@ from .helpers.const import (
     VIRTUAL_SENSOR_CHN_FIELD,
     VIRTUAL_SENSOR_DEV_CLS,
     VIRTUAL_SENSOR_PATH,
+    VIRTUAL_SENSOR_UNIT,
+    VIRTUAL_SENSOR_FACTOR,
     VIRTUAL_SENSOR_ALLOWED_CHANNELS,
 )
 from .pyextalife import (           # pylint: disable=syntax-error
@@ -65,6 +71,18 @@ from .pyextalife import (           # pylint: disable=syntax-error
 
 _LOGGER = logging.getLogger(__name__)
 
+# virtual sensor name suffix: punctuation in value path is replaced with spaces
+_PUNCTUATION_RE = re.compile(f"[{re.escape(punctuation)}]")
+_MULTI_SPACE_RE = re.compile(" +")
+
+# virtual sensor property -> SensorEntityConfig attribute it overrides
+_VIRTUAL_SENSOR_CONFIG_ATTRS = MappingProxyType({
+    VIRTUAL_SENSOR_PATH: "value_path",
+    VIRTUAL_SENSOR_DEV_CLS: "device_class",
+    VIRTUAL_SENSOR_UNIT: "native_unit_of_measurement",
+    VIRTUAL_SENSOR_FACTOR: "factor",
+})
+
 
 @dataclass
 class ELSensorEntityDescription(SensorEntityDescription):
@@ -75,13 +93,26 @@ class ELSensorEntityDescription(SensorEntityDescription):
     value_path: str | dict[ExtaLifeDeviceModel, str] = "value_1"  # path to the value field in channel
 
 
+def _tokenize_value_path(path: str) -> tuple[str | int, ...]:
+    """Split value path e.g. 'phase[1].voltage' into keys ('phase', 1, 'voltage'); list indexes are converted
+    to int"""
+    return tuple(int(key) if key.isdigit() else key for key in path.replace("[", ".").replace("]", "").split("."))
+
+
 class SensorEntityConfig:
     """ This class MUST correspond to class ELSensorEntityDescription.
     The task of this class is to have instance-based version of Entity Description/config,
     that can be manipulated / overwritten by Virtual sensors setup"""
+
+    __slots__ = (
+        "key", "factor", "_value_path", "value_path_tokens", "native_unit_of_measurement", "device_class",
+        "state_class", "suggested_display_precision",
+    )
+
     def __init__(self, descr: ELSensorEntityDescription) -> None:
         self.key: str = descr.key
         self.factor: float = descr.factor
+        self.value_path_tokens: tuple[str | int, ...] = ()
         self.value_path: str | dict[ExtaLifeDeviceModel, str] = descr.value_path
 
         self.native_unit_of_measurement = descr.native_unit_of_measurement
@@ -89,6 +120,17 @@ class SensorEntityConfig:
         self.state_class: SensorStateClass | str | None = descr.state_class
         self.suggested_display_precision: int | None = descr.suggested_display_precision
 
+    @property
+    def value_path(self) -> str | dict[ExtaLifeDeviceModel, str]:
+        """Path to the value field in channel"""
+        return self._value_path
+
+    @value_path.setter
+    def value_path(self, value: str | dict[ExtaLifeDeviceModel, str]) -> None:
+        self._value_path = value
+        # parse path once here, not on every sensor value read. Per device type paths are tokenized when resolved
+        self.value_path_tokens = _tokenize_value_path(value) if isinstance(value, str) else ()
+
 
 class ExtaSensorDeviceClass(StrEnum):
     """ExtaLife custom device classes"""
@@ -100,24 +142,20 @@ class ExtaSensorDeviceClass(StrEnum):
     MANUAL_ENERGY = "manual_energy"
 
 
-MAP_EXTA_DEV_TYPE_TO_DEV_CLASS = {}
-MAP_EXTA_DEV_TYPE_TO_DEV_CLASS.update(
-    {v: SensorDeviceClass.TEMPERATURE for v in DEVICE_ARR_SENS_TEMP}
-)
-MAP_EXTA_DEV_TYPE_TO_DEV_CLASS.update(
-    {v: SensorDeviceClass.HUMIDITY for v in DEVICE_ARR_SENS_HUMID}
-)
-MAP_EXTA_DEV_TYPE_TO_DEV_CLASS.update(
-    {v: SensorDeviceClass.ILLUMINANCE for v in DEVICE_ARR_SENS_LIGHT}
-)
-MAP_EXTA_DEV_TYPE_TO_DEV_CLASS.update(
-    {v: SensorDeviceClass.PRESSURE for v in DEVICE_ARR_SENS_PRESSURE}
-)
-MAP_EXTA_DEV_TYPE_TO_DEV_CLASS.update(
-    {v: SensorDeviceClass.ENERGY for v in DEVICE_ARR_SENS_ENERGY_METER}
-)
-
-MAP_EXTA_MULTI_CHN_TO_DEV_CLASS: dict[ExtaLifeDeviceModel, dict[int, SensorDeviceClass]] = {
+# lookup tables are read only, built once at import time
+MAP_EXTA_DEV_TYPE_TO_DEV_CLASS: Mapping[ExtaLifeDeviceModel, SensorDeviceClass] = MappingProxyType({
+    dev_type: dev_class
+    for dev_types, dev_class in (
+        (DEVICE_ARR_SENS_TEMP, SensorDeviceClass.TEMPERATURE),
+        (DEVICE_ARR_SENS_HUMID, SensorDeviceClass.HUMIDITY),
+        (DEVICE_ARR_SENS_LIGHT, SensorDeviceClass.ILLUMINANCE),
+        (DEVICE_ARR_SENS_PRESSURE, SensorDeviceClass.PRESSURE),
+        (DEVICE_ARR_SENS_ENERGY_METER, SensorDeviceClass.ENERGY),
+    )
+    for dev_type in dev_types
+})
+
+MAP_EXTA_MULTI_CHN_TO_DEV_CLASS: Mapping[ExtaLifeDeviceModel, Mapping[int, SensorDeviceClass]] = MappingProxyType({
     ExtaLifeDeviceModel.RCM21: {
         1: SensorDeviceClass.TEMPERATURE,
         2: SensorDeviceClass.HUMIDITY,
@@ -128,9 +166,9 @@ MAP_EXTA_MULTI_CHN_TO_DEV_CLASS: dict[ExtaLifeDeviceModel, dict[int, SensorDevic
         1: SensorDeviceClass.WIND_SPEED,
         2: SensorDeviceClass.ILLUMINANCE,
     }
-}
+})
 
-MAP_EXTA_ATTRIBUTE_TO_DEV_CLASS: dict[str, SensorDeviceClass] = {
+MAP_EXTA_ATTRIBUTE_TO_DEV_CLASS: Mapping[str, SensorDeviceClass] = MappingProxyType({
     "battery_status": SensorDeviceClass.BATTERY,
     "voltage": SensorDeviceClass.VOLTAGE,
     "current": SensorDeviceClass.CURRENT,
@@ -145,7 +183,7 @@ MAP_EXTA_ATTRIBUTE_TO_DEV_CLASS: dict[str, SensorDeviceClass] = {
     "active_energy_solar": SensorDeviceClass.ENERGY,
     "reactive_energy_solar": ExtaSensorDeviceClass.REACTIVE_ENERGY,
     "manual_energy": ExtaSensorDeviceClass.MANUAL_ENERGY,
-}
+})
 
 VIRTUAL_SENSOR_RESTRICTIONS = {
   "battery_status": {VIRTUAL_SENSOR_ALLOWED_CHANNELS: (1,)}
@@ -154,7 +192,7 @@ VIRTUAL_SENSOR_RESTRICTIONS = {
 # List of additional sensors which are created based on a property
 # The key is the property name
 # noinspection PyArgumentList
-SENSOR_TYPES: dict[SensorDeviceClass | ExtaSensorDeviceClass, ELSensorEntityDescription] = {
+SENSOR_TYPES: Mapping[SensorDeviceClass | ExtaSensorDeviceClass, ELSensorEntityDescription] = MappingProxyType({
     SensorDeviceClass.WIND_SPEED: ELSensorEntityDescription(
         native_unit_of_measurement=UnitOfSpeed.METERS_PER_SECOND,
         device_class=SensorDeviceClass.WIND_SPEED,
@@ -271,7 +309,12 @@ SENSOR_TYPES: dict[SensorDeviceClass | ExtaSensorDeviceClass, ELSensorEntityDesc
         state_class=SensorStateClass.MEASUREMENT,
         factor=1,
     ),
-}
+})
+
+# entities share config of their device class, it is copied only when entity needs to change it
+SENSOR_CONFIGS: Mapping[SensorDeviceClass | ExtaSensorDeviceClass, SensorEntityConfig] = MappingProxyType(
+    {device_class: SensorEntityConfig(descr) for device_class, descr in SENSOR_TYPES.items()}
+)
 
 
 # noinspection PyUnusedLocal
@@ -320,9 +363,15 @@ class ExtaLifeSensorBase(ExtaLifeChannel, SensorEntity):
                  config_entry: ConfigEntry, device_class: SensorDeviceClass | ExtaSensorDeviceClass):
         super().__init__(channel, config_entry)
 
-        self._config: SensorEntityConfig = SensorEntityConfig(SENSOR_TYPES[device_class])
+        self._config: SensorEntityConfig = SENSOR_CONFIGS[device_class]
+
+        # state attributes are rebuilt only when channel data was replaced or updated by notification
+        self._channel_data_version: int = 0
+        self._attr_cache: dict[str, Any] | None = None
+        self._attr_cache_key: tuple[dict[str, Any], int] | None = None
 
         if isinstance(self._config.value_path, dict):
+            self._config = copy(self._config)
             self._config.value_path = self._config.value_path.get(self.device_type, "value_1")
 
     @property
@@ -351,17 +400,15 @@ class ExtaLifeSensorBase(ExtaLifeChannel, SensorEntity):
         """Return the value reported by the sensor."""
 
         try:
-            value = self.get_value_from_attr_path(self._config.value_path)
-        except Exception as err:
-            _LOGGER.error("failed to read sensor native value, device_type=%s, %s", self.device_type.name, err)
-            value = 0
-
-        if value:
-            if isinstance(value, str) or isinstance(value, int):
-                value = float(value)
-            value = value * self._config.factor
+            value = self.get_value_from_attr_path(self._config.value_path_tokens)
+        except (KeyError, IndexError, TypeError) as err:
+            # value path does not match channel data, report no value (unknown) instead of a zero reading;
+            # this is evaluated on every state write so do not flood the log
+            _LOGGER.debug("failed to read sensor native value, device_type=%s, %r", self.device_type.name, err)
+            return None
 
-        return value
+        # str, int and float values are all normalized by single float() call
+        return float(value) * self._config.factor if value else value
 
     @property
     def suggested_display_precision(self) -> int | None:        
@@ -374,48 +421,39 @@ class ExtaLifeSensorBase(ExtaLifeChannel, SensorEntity):
     def extra_state_attributes(self) -> Mapping[str, Any] | None:
         """Return device specific state attributes."""
 
+        cache_key = self._attr_cache_key
+        if cache_key is not None and cache_key[0] is self.channel_data and cache_key[1] == self._channel_data_version:
+            return self._attr_cache
+
         es_attrs = self._mapping_to_dict(super().extra_state_attributes)
 
         self._extra_state_attribute_update(self.channel_data, es_attrs, "sync_time")
         self._extra_state_attribute_update(self.channel_data, es_attrs, "last_sync")
 
-        return self._format_state_attr(es_attrs)
+        self._attr_cache = self._format_state_attr(es_attrs)
+        self._attr_cache_key = (self.channel_data, self._channel_data_version)
+        return self._attr_cache
 
     def on_state_notification(self, data: dict[str, Any]) -> None:
         """React on state notification from controller"""
         super().on_state_notification(data)
 
         self.channel_data.update(data)
+        self._channel_data_version += 1
 
         # synchronize DataManager data with processed update & entity data
         self.sync_data_update_ha()
 
-    def get_value_from_attr_path(self, attr_path: str):
-        """Extract value from encoded path"""
-        # Example path: 'phase[1].voltage   -> array phase, row 1, field voltage
+    def get_value_from_attr_path(self, attr_path: tuple[str | int, ...]):
+        """Extract value from tokenized path"""
+        # Example path: 'phase[1].voltage   -> array phase, row 1, field voltage, see _tokenize_value_path()
         # attr.append({"dev_class": dev_class, "path": f"?phase[{c}]{k}", "unit": unit})
 
-        def find_element(path: str, dictionary: dict):
-            """Read field value by path e.g. test[1].value21.
-            The path must lead to a single field, nit dict or list. The path is normalized to a '.' separated"""
-
-            def _find_element(keys: list, _dictionary: dict):
-                rv = _dictionary
-                if isinstance(_dictionary, dict):
-                    rv = _find_element(keys[1:], rv[keys[0]])
-                elif isinstance(_dictionary, list):
-                    if keys[0].isnumeric():
-                        rv = _find_element(keys[1:], _dictionary[int(keys[0])])
-                else:
-                    return rv
-                return rv
-
-            _keys = path.replace("[", ".")
-            _keys = _keys.replace("]", "")
-
-            return _find_element(_keys.split("."), dictionary)
-
-        return find_element(attr_path, self.channel_data)
+        # keys are str for dict fields and int for list rows, so plain indexing walks the path
+        value = self.channel_data
+        for key in attr_path:
+            value = value[key]
+        return value
 
 
 class ExtaLifeSensor(ExtaLifeSensorBase):
@@ -446,14 +484,15 @@ class ExtaLifeSensor(ExtaLifeSensorBase):
         data = self.channel_data
         phase = data.get("phase")  # this is for MEM-21
         if phase is not None:
-            for p in phase:
-                for k, v in p.items():      # pylint: disable=unused-variable
-                    dev_class = MAP_EXTA_ATTRIBUTE_TO_DEV_CLASS.get(k)
+            attr_to_dev_class = MAP_EXTA_ATTRIBUTE_TO_DEV_CLASS.get
+            for idx, p in enumerate(phase):
+                for k in p:
+                    dev_class = attr_to_dev_class(k)
                     if dev_class:
                         attr.append(
                             {
                                 VIRTUAL_SENSOR_DEV_CLS: dev_class,
-                                VIRTUAL_SENSOR_PATH: f"phase[{phase.index(p)}].{k}",
+                                VIRTUAL_SENSOR_PATH: f"phase[{idx}].{k}",
                             }
                         )
 
@@ -473,10 +512,19 @@ class ExtaLifeVirtualSensor(ExtaLifeSensorBase):
 
         self.override_config_from_dict(self._virtual_prop)
 
+        # value path of virtual sensor never changes, unlike channel alias which is part of the name
+        self._name_suffix: str = self.get_name_suffix(self._virtual_prop.get(VIRTUAL_SENSOR_PATH))
+
     def override_config_from_dict(self, override: dict[str, Any]) -> None:
         """Override sensor config from a dict"""
-        for k, v in override.items():           # pylint: disable=unused-variable
-            setattr(self._config, k, v)
+        # never modify config shared with other entities
+        self._config = copy(self._config)
+        for k, v in override.items():
+            attr = _VIRTUAL_SENSOR_CONFIG_ATTRS.get(k)
+            if attr is None:
+                _LOGGER.debug("Virtual sensor property '%s' does not override sensor config, skipped", k)
+                continue
+            setattr(self._config, attr, v)
 
     def get_unique_id(self) -> str:
         """Override return a unique ID.
@@ -490,16 +538,12 @@ class ExtaLifeVirtualSensor(ExtaLifeSensorBase):
         """Derive name suffix for attribute (virtual) sensor entities
         Simply escape special characters with spaces"""
 
-        from re import escape, sub
-        from string import punctuation
-
-        chars = escape(punctuation)
-        escaped = sub(r"[" + chars + "]", " ", path)
-        escaped = sub(' +', ' ', escaped)       # remove double spaces
+        escaped = _PUNCTUATION_RE.sub(" ", path)
+        escaped = _MULTI_SPACE_RE.sub(" ", escaped)       # remove double spaces
 
         return escaped
 
     @property
     def name(self) -> str:
         """Entity name = default name + escaped name suffix (whitespaces)"""
-        return f"{super().name} {self.get_name_suffix(self._virtual_prop.get(VIRTUAL_SENSOR_PATH))}"
+        return f"{super().name} {self._name_suffix}"
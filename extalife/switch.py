@@ -60,6 +60,8 @@ class ExtaLifeSwitch(ExtaLifeChannel, SwitchEntity):
         super().__init__(channel, config_entry)
 
         self._assumed_on: bool = False
+        # channel reports its state in one of these fields, depending on device model
+        self._state_field: str = "output_state" if self.channel_data.get("output_state") is not None else "power"
 
         self.push_virtual_sensor_channels(DOMAIN_VIRTUAL_SWITCH_SENSOR, channel)
 
@@ -67,8 +69,7 @@ class ExtaLifeSwitch(ExtaLifeChannel, SwitchEntity):
         """Turn on the switch."""
         if not self.is_exta_free:
             if await self.async_action(ExtaLifeAction.EXTA_LIFE_TURN_ON):
-                field = "power" if self.channel_data.get("output_state") is None else "output_state"
-                self.channel_data[field] = 1
+                self.channel_data[self._state_field] = 1
                 self.async_schedule_update_ha_state()
         else:
             if (await self.async_action(ExtaLifeAction.EXTA_FREE_TURN_ON_PRESS) and
@@ -80,8 +81,7 @@ class ExtaLifeSwitch(ExtaLifeChannel, SwitchEntity):
         """Turn off the switch."""
         if not self.is_exta_free:
             if await self.async_action(ExtaLifeAction.EXTA_LIFE_TURN_OFF):
-                field = "power" if self.channel_data.get("output_state") is None else "output_state"
-                self.channel_data[field] = 0
+                self.channel_data[self._state_field] = 0
                 self.async_schedule_update_ha_state()
         else:
             if (await self.async_action(ExtaLifeAction.EXTA_FREE_TURN_OFF_PRESS) and
@@ -95,8 +95,7 @@ class ExtaLifeSwitch(ExtaLifeChannel, SwitchEntity):
         if self.is_exta_free:
             return self._assumed_on
 
-        field = "power" if self.channel_data.get("output_state") is None else "output_state"
-        state = self.channel_data.get(field)
+        state = self.channel_data.get(self._state_field)
 
         if state == 1 or state is True:
             return True
@@ -106,16 +105,11 @@ class ExtaLifeSwitch(ExtaLifeChannel, SwitchEntity):
         """ React on state notification from controller """
 
         state = data.get("state")
-        ch_data = self.channel_data.copy()
-
-        if ch_data.get("power") is not None:
-            ch_data["power"] = 1 if state else 0
-        elif ch_data.get("output_state") is not None:
-            ch_data["output_state"] = state
+        value = state if self._state_field == "output_state" else 1 if state else 0
 
         # update only if notification data contains new status; prevent HA event bus overloading
-        if ch_data != self.channel_data:
-            self.channel_data.update(ch_data)
+        if self.channel_data.get(self._state_field) != value:
+            self.channel_data[self._state_field] = value
 
             # synchronize DataManager data with processed update & entity data
             self.sync_data_update_ha()
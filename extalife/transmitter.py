@@ -73,12 +73,9 @@ class ExtaLifeTransmitter(PseudoPlatform):
         self._signal_data_notif_remove_callback()
 
     def _sync_state_notif_update_callback(self, data) -> None:
-        if self.device:
-            _LOGGER.debug("_sync_state_notif_update_callback: %s", data)
-            self._device.controller_event(data)
-
         # pass notification to device for processing
         if self.device:
+            _LOGGER.debug("_sync_state_notif_update_callback: %s", data)
             self._device.controller_event(data)
 
 
@@ -89,7 +86,7 @@ class TransmitterManager:
 
         self._config_entry = config_entry
 
-        self._transmitters: dict[id, str] = {}
+        self._transmitters: dict[str, ExtaLifeTransmitter] = {}
 
     @property
     def device_manager(self) -> DeviceManagerType:
@@ -99,8 +96,7 @@ class TransmitterManager:
     async def add(self, channel_data: dict):
         """ Add transmitter instance to buffer """
         transmitter = ExtaLifeTransmitter(self._config_entry, channel_data)
-        data = {id: transmitter.id}
-        self._transmitters.update(data)
+        self._transmitters[transmitter.id] = transmitter
 
         await self.register_device(transmitter)
         await transmitter.async_added_to_hass()
@@ -113,5 +109,6 @@ class TransmitterManager:
 
     async def unload_transmitters(self) -> None:
         """ Unload transmitters: cleanup, unregister signals etc """
-        for tr_id, transmitter in self._transmitters:
+        for transmitter in self._transmitters.values():
             await transmitter.async_will_remove_from_hass()
+        self._transmitters.clear()
@@ -42,11 +42,12 @@ async def async_setup_entry(
 
 
 class ExtaLifeUpdate(ExtaLifeChannel, UpdateEntity):
-    def __init__(self, channel: dict[str, Any], config_entry: ConfigEntry):
-        super().__init__(channel, config_entry)
 
-        self._attr_device_class = UpdateDeviceClass.FIRMWARE
+    # same for all instances
+    _attr_device_class = UpdateDeviceClass.FIRMWARE
+    _attr_supported_features = (
+        UpdateEntityFeature.INSTALL | UpdateEntityFeature.BACKUP | UpdateEntityFeature.RELEASE_NOTES
+    )
 
-        self._attr_supported_features = UpdateEntityFeature.INSTALL
-        self._attr_supported_features |= UpdateEntityFeature.BACKUP
-        self._attr_supported_features |= UpdateEntityFeature.RELEASE_NOTES
+    def __init__(self, channel: dict[str, Any], config_entry: ConfigEntry):
+        super().__init__(channel, config_entry)